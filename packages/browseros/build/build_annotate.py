@@ -16,11 +16,15 @@ from pathlib import Path
 from utils import log_info, log_error, log_success, log_warning
 
 
+# Prefer the C (libyaml) parser, falling back to pure Python
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_features(features_file: Path) -> dict:
     """Load features from YAML file"""
     try:
-        with open(features_file, 'r') as f:
-            data = yaml.safe_load(f)
+        with open(features_file, 'rb') as f:
+            data = yaml.load(f, Loader=_YamlLoader)
             return data.get('features', {})
     except Exception as e:
         log_error(f"Failed to load features file: {e}")
@@ -35,48 +39,46 @@ def check_git_repo(chromium_src: Path) -> bool:
 
 def get_modified_files(chromium_src: Path, files: list[str]) -> list[str]:
     """Get list of files that have modifications or are untracked"""
-    modified = []
+    existing = [str(f) for f in files if (chromium_src / f).exists()]
+    if not existing:
+        return []
 
-    for file_path in files:
-        full_path = chromium_src / file_path
-
-        # Check if file exists
-        if not full_path.exists():
-            continue
-
-        try:
-            # Check git status for this file
-            result = subprocess.run(
-                ['git', 'status', '--porcelain', str(file_path)],
-                cwd=chromium_src,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            # If output exists, file has changes
-            if result.stdout.strip():
-                modified.append(file_path)
-
-        except subprocess.CalledProcessError:
-            # If git status fails, skip this file
+    try:
+        # One git status for every file instead of one process per file
+        result = subprocess.run(
+            ['git', 'status', '--porcelain', '-z', '--untracked-files=all', '--', *existing],
+            cwd=chromium_src,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except subprocess.CalledProcessError:
+        return []
+
+    # -z entries are "XY path"; renames carry the original path as an extra field
+    changed = set()
+    entries = iter(result.stdout.split('\0'))
+    for entry in entries:
+        if len(entry) < 4:
             continue
+        changed.add(entry[3:])
+        if entry[0] in 'RC':
+            changed.add(next(entries, ''))
 
-    return modified
+    return [f for f in files if Path(f).as_posix() in changed]
 
 
 def git_add_and_commit(chromium_src: Path, files: list[str], commit_message: str) -> bool:
     """Add files and create commit"""
 
-    # First, add all files
+    # First, add all files in a single git invocation
     try:
-        for file_path in files:
-            subprocess.run(
-                ['git', 'add', str(file_path)],
-                cwd=chromium_src,
-                check=True,
-                capture_output=True
-            )
+        subprocess.run(
+            ['git', 'add', '--', *(str(f) for f in files)],
+            cwd=chromium_src,
+            check=True,
+            capture_output=True
+        )
     except subprocess.CalledProcessError as e:
         log_error(f"Failed to add files: {e}")
         return False
@@ -113,6 +115,13 @@ def process_features(chromium_src: Path, features_file: Path) -> int:
 
     commits_created = 0
 
+    # Check every feature's files with one git status; committed files are
+    # removed so features sharing a file don't re-commit it
+    all_files = list(dict.fromkeys(
+        f for data in features.values() for f in data.get('files', [])
+    ))
+    pending = set(get_modified_files(chromium_src, all_files))
+
     for feature_name, feature_data in features.items():
         description = feature_data.get('description', feature_name)
         files = feature_data.get('files', [])
@@ -125,7 +134,7 @@ def process_features(chromium_src: Path, features_file: Path) -> int:
             continue
 
         # Find files with modifications
-        modified_files = get_modified_files(chromium_src, files)
+        modified_files = [f for f in files if f in pending]
 
         if not modified_files:
             log_warning(f"   No modified files ({len(files)} files checked)")
@@ -140,6 +149,7 @@ def process_features(chromium_src: Path, features_file: Path) -> int:
         if git_add_and_commit(chromium_src, modified_files, commit_message):
             log_success(f"   ✓ Committed {len(modified_files)} file(s)")
             commits_created += 1
+            pending.difference_update(modified_files)
         else:
             log_warning("   No changes staged, skipping commit")
 
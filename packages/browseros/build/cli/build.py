@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """Build CLI - Modular build system for BrowserOS"""
 
+import importlib
 import os
 import sys
 import time
+from collections.abc import Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Type
 
 import typer
 
@@ -22,7 +26,13 @@ from ..common.notify import (
     notify_module_completion,
     set_build_context,
 )
-from ..common.module import ValidationError
+from ..common.module import CommandModule, ValidationError
+from ..common.module_cache import (
+    StampChain,
+    clear_stamp,
+    get_changed_paths,
+    write_stamp,
+)
 from ..common.utils import (
     log_error,
     log_info,
@@ -33,59 +43,68 @@ from ..common.utils import (
     IS_LINUX,
 )
 
-# Import all module classes
-from ..modules.setup.clean import CleanModule
-from ..modules.setup.git import GitSetupModule, SparkleSetupModule
-from ..modules.setup.configure import ConfigureModule
-from ..modules.compile import CompileModule, UniversalBuildModule
-from ..modules.patches.patches import PatchesModule
-from ..modules.patches.series_patches import SeriesPatchesModule
-from ..modules.resources.chromium_replace import ChromiumReplaceModule
-from ..modules.resources.string_replaces import StringReplacesModule
-from ..modules.resources.resources import ResourcesModule
-from ..modules.extensions import BundledExtensionsModule
-from ..modules.storage import UploadModule, DownloadResourcesModule
-
-# Platform-specific modules (imported unconditionally - validation handles platform checks)
-from ..modules.sign.macos import MacOSSignModule
-from ..modules.sign.windows import WindowsSignModule
-from ..modules.sign.linux import LinuxSignModule
-from ..modules.sign.sparkle import SparkleSignModule
-from ..modules.package.macos import MacOSPackageModule
-from ..modules.package.windows import WindowsPackageModule
-from ..modules.package.linux import LinuxPackageModule
-
-AVAILABLE_MODULES = {
+# Module classes are resolved lazily: importing every platform's signing,
+# packaging and upload stack up front made --help/--list pay for all of them.
+_MODULE_PATHS = {
     # Setup & Environment
-    "clean": CleanModule,
-    "git_setup": GitSetupModule,
-    "sparkle_setup": SparkleSetupModule,
-    "configure": ConfigureModule,
+    "clean": "..modules.setup.clean:CleanModule",
+    "git_setup": "..modules.setup.git:GitSetupModule",
+    "sparkle_setup": "..modules.setup.git:SparkleSetupModule",
+    "configure": "..modules.setup.configure:ConfigureModule",
     # Patches & Resources
-    "patches": PatchesModule,
-    "series_patches": SeriesPatchesModule,
-    "chromium_replace": ChromiumReplaceModule,
-    "string_replaces": StringReplacesModule,
-    "download_resources": DownloadResourcesModule,  # Download binaries from R2
-    "resources": ResourcesModule,
-    "bundled_extensions": BundledExtensionsModule,
+    "patches": "..modules.patches.patches:PatchesModule",
+    "series_patches": "..modules.patches.series_patches:SeriesPatchesModule",
+    "chromium_replace": "..modules.resources.chromium_replace:ChromiumReplaceModule",
+    "string_replaces": "..modules.resources.string_replaces:StringReplacesModule",
+    "download_resources": "..modules.storage:DownloadResourcesModule",  # Download binaries from R2
+    "resources": "..modules.resources.resources:ResourcesModule",
+    "bundled_extensions": "..modules.extensions:BundledExtensionsModule",
     # Build
-    "compile": CompileModule,
-    "universal_build": UniversalBuildModule,  # macOS universal binary (arm64 + x64)
+    "compile": "..modules.compile:CompileModule",
+    "universal_build": "..modules.compile:UniversalBuildModule",  # macOS universal binary (arm64 + x64)
     # Sign (platform-specific, validated at runtime)
-    "sign_macos": MacOSSignModule,
-    "sign_windows": WindowsSignModule,
-    "sign_linux": LinuxSignModule,
-    "sparkle_sign": SparkleSignModule,  # macOS Sparkle signing for auto-update
+    "sign_macos": "..modules.sign.macos:MacOSSignModule",
+    "sign_windows": "..modules.sign.windows:WindowsSignModule",
+    "sign_linux": "..modules.sign.linux:LinuxSignModule",
+    "sparkle_sign": "..modules.sign.sparkle:SparkleSignModule",  # macOS Sparkle signing for auto-update
     # Package (platform-specific, validated at runtime)
-    "package_macos": MacOSPackageModule,
-    "package_windows": WindowsPackageModule,
-    "package_linux": LinuxPackageModule,
+    "package_macos": "..modules.package.macos:MacOSPackageModule",
+    "package_windows": "..modules.package.windows:WindowsPackageModule",
+    "package_linux": "..modules.package.linux:LinuxPackageModule",
     # Storage (upload/download)
-    "upload": UploadModule,
+    "upload": "..modules.storage:UploadModule",
 }
 
 
+@lru_cache(maxsize=None)
+def _load(module_name: str) -> Type[CommandModule]:
+    """Import and return the module class registered under module_name"""
+    module_path, class_name = _MODULE_PATHS[module_name].split(":")
+    return getattr(importlib.import_module(module_path, __package__), class_name)
+
+
+class _ModuleRegistry(Mapping):
+    """Read-only name -> module class mapping that imports classes on access"""
+
+    def __getitem__(self, module_name: str) -> Type[CommandModule]:
+        if module_name not in _MODULE_PATHS:
+            raise KeyError(module_name)
+        return _load(module_name)
+
+    def __contains__(self, module_name: object) -> bool:
+        return module_name in _MODULE_PATHS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_MODULE_PATHS)
+
+    def __len__(self) -> int:
+        return len(_MODULE_PATHS)
+
+
+AVAILABLE_MODULES = _ModuleRegistry()
+
+
+@lru_cache(maxsize=1)
 def _get_sign_module():
     """Get platform-specific sign module name"""
     if IS_MACOS():
@@ -99,6 +118,7 @@ def _get_sign_module():
         sys.exit(1)
 
 
+@lru_cache(maxsize=1)
 def _get_package_module():
     """Get platform-specific package module name"""
     if IS_MACOS():
@@ -112,32 +132,38 @@ def _get_package_module():
         sys.exit(1)
 
 
-# Fixed execution order - flags enable/disable phases, order is always the same
-EXECUTION_ORDER = [
-    # Phase 1: Setup & Clean
-    ("setup", ["clean", "git_setup", "sparkle_setup"]),
-    # Phase 2: Patches & Resources
-    (
-        "prep",
-        [
-            "download_resources",
-            "resources",
-            "bundled_extensions",
-            "chromium_replace",
-            "string_replaces",
-            "patches",
-            "configure",
-        ],
-    ),
-    # Phase 3: Build
-    ("build", ["compile"]),
-    # Phase 4: Code Signing (platform-aware)
-    ("sign", [_get_sign_module()]),
-    # Phase 5: Packaging (platform-aware)
-    ("package", [_get_package_module()]),
-    # Phase 6: Upload
-    ("upload", ["upload"]),
-]
+@lru_cache(maxsize=1)
+def _execution_order() -> list[tuple[str, list[str]]]:
+    """Fixed execution order - flags enable/disable phases, order is always the same
+
+    Built on first use so importing the CLI (--help, --list, --modules)
+    doesn't probe the platform or exit on unsupported hosts.
+    """
+    return [
+        # Phase 1: Setup & Clean
+        ("setup", ["clean", "git_setup", "sparkle_setup"]),
+        # Phase 2: Patches & Resources
+        (
+            "prep",
+            [
+                "download_resources",
+                "resources",
+                "bundled_extensions",
+                "chromium_replace",
+                "string_replaces",
+                "patches",
+                "configure",
+            ],
+        ),
+        # Phase 3: Build
+        ("build", ["compile"]),
+        # Phase 4: Code Signing (platform-aware)
+        ("sign", [_get_sign_module()]),
+        # Phase 5: Packaging (platform-aware)
+        ("package", [_get_package_module()]),
+        # Phase 6: Upload
+        ("upload", ["upload"]),
+    ]
 
 # Modules that trigger Slack notifications (to reduce verbosity)
 NOTIFY_MODULES = [
@@ -152,69 +178,222 @@ NOTIFY_MODULES = [
 ]
 
 
+def _pipeline_dependencies(
+    pipeline: list[str],
+    available_modules: Mapping[str, Type[CommandModule]],
+) -> list[set[int]]:
+    """For each pipeline step, the indices of earlier steps it must wait for.
+
+    A module waits for everything before it unless its class declares
+    depends_on, in which case only the named modules (if earlier in the
+    pipeline) gate it. Without any declarations this is the plain
+    sequential order.
+    """
+    dependencies = []
+    for index, module_name in enumerate(pipeline):
+        declared = available_modules[module_name].depends_on
+        dependencies.append(
+            {
+                earlier
+                for earlier in range(index)
+                if declared is None or pipeline[earlier] in declared
+            }
+        )
+    return dependencies
+
+
+def _run_module(
+    ctx: Context,
+    module_name: str,
+    module_class: Type[CommandModule],
+    pipeline_name: str,
+    stamps: StampChain,
+) -> float:
+    """Validate and execute a single module, raising typer.Exit on failure
+
+    Returns:
+        Seconds spent executing the module (0 when it was skipped)
+    """
+    log_info(f"\n{'='*70}")
+    log_info(f"🔧 Running module: {module_name}")
+    log_info(f"{'='*70}")
+
+    module = module_class()
+
+    # Skip modules whose inputs match their last successful run and whose
+    # edits are still in the tree
+    digest = stamps.digest(module_name, module)
+    if digest is not None and stamps.is_current(module_name, digest):
+        log_success(f"Module {module_name} cached (inputs unchanged), skipping")
+        return 0.0
+
+    # Notify module start and track timing (only for key modules)
+    if module_name in NOTIFY_MODULES:
+        notify_module_start(module_name)
+    module_start = time.time()
+
+    # Validate right before executing (fail fast)
+    try:
+        module.validate(ctx)
+    except ValidationError as e:
+        log_error(f"Validation failed for {module_name}: {e}")
+        notify_pipeline_error(pipeline_name, f"{module_name} validation failed: {e}")
+        raise typer.Exit(1)
+
+    # Execute module (a stale stamp must not survive a failed run)
+    if digest is not None:
+        clear_stamp(ctx.root_dir, module_name)
+    try:
+        module.execute(ctx)
+        if digest is not None:
+            write_stamp(
+                ctx.root_dir,
+                module_name,
+                digest,
+                ctx.semantic_version,
+                get_changed_paths(ctx.chromium_src),
+            )
+        module_duration = time.time() - module_start
+        if module_name in NOTIFY_MODULES:
+            notify_module_completion(module_name, module_duration)
+        log_success(f"Module {module_name} completed in {module_duration:.1f}s")
+        return module_duration
+    except Exception as e:
+        log_error(f"Module {module_name} failed: {e}")
+        notify_pipeline_error(pipeline_name, f"{module_name} failed: {e}")
+        raise typer.Exit(1)
+
+
+def _critical_path(
+    pipeline: list[str], dependencies: list[set[int]], durations: dict[int, float]
+) -> tuple[list[str], float]:
+    """Longest chain of dependent modules by execution time
+
+    This chain bounds the pipeline's wall time however much else overlaps,
+    so it is the one worth shortening. Modules that took no time (skipped
+    or cached) are left out of the returned names.
+    """
+    costs: list[float] = []
+    previous: list[Optional[int]] = []
+    for index in range(len(pipeline)):
+        before = max(dependencies[index], key=lambda i: costs[i], default=None)
+        base = costs[before] if before is not None else 0.0
+        costs.append(durations.get(index, 0.0) + base)
+        previous.append(before)
+
+    if not costs:
+        return [], 0.0
+    index: Optional[int] = max(range(len(costs)), key=costs.__getitem__)
+    total = costs[index]
+    chain = []
+    while index is not None:
+        if durations.get(index):
+            chain.append(pipeline[index])
+        index = previous[index]
+    return chain[::-1], total
+
+
 def execute_pipeline(
     ctx: Context,
     pipeline: list[str],
-    available_modules: dict,
+    available_modules: Mapping[str, Type[CommandModule]],
     pipeline_name: str = "build",
+    use_cache: bool = True,
+    force: Optional[list[str]] = None,
 ) -> None:
-    """Execute a build pipeline by running modules sequentially.
+    """Execute a build pipeline, running independent modules concurrently.
 
     Args:
         ctx: Build context with paths and configuration
         pipeline: List of module names to execute in order
         available_modules: Dictionary mapping module names to module classes
         pipeline_name: Name of pipeline for notifications (default: "build")
+        use_cache: Skip cacheable modules whose inputs are unchanged
+        force: Modules whose cache stamps are dropped so they always run
 
     Raises:
         typer.Exit: On module validation failure, execution failure, or interrupt
 
     Design:
-        - Executes modules sequentially in pipeline order
+        - Modules start in pipeline order once their dependencies finish;
+          modules without a depends_on declaration wait for every earlier one
+        - Skips modules whose input_hash matches their last successful run,
+          as long as the files that run left modified still are
         - Validates each module before execution (fail fast)
-        - Tracks timing for each module and total pipeline
+        - A module with nothing to overlap runs on the calling thread, so
+          Ctrl+C interrupts it directly
+        - A failure or interrupt stops scheduling and cancels queued work
+          without waiting for modules still running on worker threads
+        - Tracks timing for each module and total pipeline, and logs the
+          critical path (the dependency chain that bounded the wall time)
         - Sends notifications at key lifecycle events
         - Handles interrupts (Ctrl+C) gracefully with cleanup
     """
     start_time = time.time()
     notify_pipeline_start(pipeline_name, pipeline)
 
+    dependencies = _pipeline_dependencies(pipeline, available_modules)
+    stamps = StampChain(ctx, use_cache)
+    for module_name in force or []:
+        clear_stamp(ctx.root_dir, module_name)
+
+    # Leading modules with current stamps (same inputs, edits still in the
+    # tree) change nothing, so skip them up front without validating or
+    # scheduling them
+    skipped = 0
+    for module_name in pipeline:
+        if not stamps.skip_if_current(module_name, available_modules[module_name]()):
+            break
+        log_info(f"⏭ Skipping cached: {module_name}")
+        skipped += 1
+
+    pending = list(range(skipped, len(pipeline)))
+    running = {}
+    finished = set(range(skipped))
+    durations: dict[int, float] = {}
+
+    # Modules mostly wait on subprocesses and the network, and dependencies
+    # already bound how many can be ready at once
+    executor = ThreadPoolExecutor(max_workers=max(1, len(pipeline)))
     try:
-        for module_name in pipeline:
-            log_info(f"\n{'='*70}")
-            log_info(f"🔧 Running module: {module_name}")
-            log_info(f"{'='*70}")
-
-            # Instantiate module
-            module_class = available_modules[module_name]
-            module = module_class()
-
-            # Notify module start and track timing (only for key modules)
-            if module_name in NOTIFY_MODULES:
-                notify_module_start(module_name)
-            module_start = time.time()
-
-            # Validate right before executing (fail fast)
-            try:
-                module.validate(ctx)
-            except ValidationError as e:
-                log_error(f"Validation failed for {module_name}: {e}")
-                notify_pipeline_error(
-                    pipeline_name, f"{module_name} validation failed: {e}"
+        while pending or running:
+            ready = [i for i in pending if dependencies[i] <= finished]
+            if len(ready) == 1 and not running:
+                # Nothing to overlap with: run it here, where Ctrl+C lands
+                index = ready[0]
+                pending.remove(index)
+                module_name = pipeline[index]
+                durations[index] = _run_module(
+                    ctx,
+                    module_name,
+                    available_modules[module_name],
+                    pipeline_name,
+                    stamps,
+                )
+                finished.add(index)
+                continue
+
+            for index in ready:
+                pending.remove(index)
+                module_name = pipeline[index]
+                future = executor.submit(
+                    _run_module,
+                    ctx,
+                    module_name,
+                    available_modules[module_name],
+                    pipeline_name,
+                    stamps,
                 )
-                raise typer.Exit(1)
-
-            # Execute module
-            try:
-                module.execute(ctx)
-                module_duration = time.time() - module_start
-                if module_name in NOTIFY_MODULES:
-                    notify_module_completion(module_name, module_duration)
-                log_success(f"Module {module_name} completed in {module_duration:.1f}s")
-            except Exception as e:
-                log_error(f"Module {module_name} failed: {e}")
-                notify_pipeline_error(pipeline_name, f"{module_name} failed: {e}")
-                raise typer.Exit(1)
+                running[future] = index
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                # Re-raises typer.Exit from a failed module
+                durations[index] = future.result()
+                finished.add(index)
+
+        executor.shutdown()
 
         # Pipeline completed successfully
         duration = time.time() - start_time
@@ -223,18 +402,27 @@ def execute_pipeline(
 
         log_info("\n" + "=" * 70)
         log_success(f"✅ Pipeline completed successfully in {mins}m {secs}s")
+        chain, chain_duration = _critical_path(pipeline, dependencies, durations)
+        # Only informative when some modules overlapped the chain
+        if 1 < len(chain) < len(durations):
+            log_info(
+                f"⏱ Critical path ({chain_duration:.1f}s): {' → '.join(chain)}"
+            )
         log_info("=" * 70)
 
         notify_pipeline_end(pipeline_name, duration)
 
     except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
         log_error("\n❌ Pipeline interrupted")
         notify_pipeline_error(pipeline_name, "Interrupted by user")
         raise typer.Exit(130)
     except typer.Exit:
         # Re-raise typer.Exit (from validation/execution failures)
+        executor.shutdown(wait=False, cancel_futures=True)
         raise
     except Exception as e:
+        executor.shutdown(wait=False, cancel_futures=True)
         log_error(f"\n❌ Pipeline failed: {e}")
         notify_pipeline_error(pipeline_name, str(e))
         raise typer.Exit(1)
@@ -291,6 +479,21 @@ def main(
         "--upload",
         help="Run upload phase (upload artifacts)",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Re-run every module even if its inputs are unchanged",
+    ),
+    force: Optional[str] = typer.Option(
+        None,
+        "--force",
+        help="Comma-separated modules to re-run even if their inputs are unchanged",
+    ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        help="Abort resource copying at the first failing operation",
+    ),
     # Global options that override config
     arch: Optional[str] = typer.Option(
         None,
@@ -408,13 +611,14 @@ def main(
     except ValueError as e:
         log_error(str(e))
         raise typer.Exit(1)
+    ctx.fail_fast = fail_fast
 
     # Resolve pipeline (CONFIG mode or DIRECT mode)
     try:
         pipeline = resolve_pipeline(
             cli_args,
             config_data,
-            execution_order=EXECUTION_ORDER,
+            execution_order=_execution_order() if has_flags else None,
         )
     except ValueError as e:
         log_error(str(e))
@@ -424,20 +628,18 @@ def main(
     if has_flags:
         log_info("\n📋 Execution Plan (auto-ordered):")
         log_info("-" * 70)
+        # Walk the same phase table the resolver used; platform-aware phases
+        # show which module they resolved to
         phase_names = []
-        if setup:
-            phase_names.append("setup")
+        for phase_name, phase_modules in _execution_order():
+            if not cli_args[phase_name]:
+                continue
+            if phase_name in ("sign", "package"):
+                phase_names.append(f"{phase_name} (→ {phase_modules[0]})")
+            else:
+                phase_names.append(phase_name)
         if prep:
-            phase_names.append("prep")
             log_warning("⚠️  --prep does NOT apply series_patches. Run 'browseros build -m series_patches' separately if needed.")
-        if build:
-            phase_names.append("build")
-        if sign:
-            phase_names.append(f"sign (→ {_get_sign_module()})")
-        if package:
-            phase_names.append(f"package (→ {_get_package_module()})")
-        if upload:
-            phase_names.append("upload")
 
         for phase_name in phase_names:
             log_info(f"  ✓ {phase_name}")
@@ -475,4 +677,11 @@ def main(
     set_build_context(os_name, ctx.architecture)
 
     # Execute pipeline
-    execute_pipeline(ctx, pipeline, AVAILABLE_MODULES, pipeline_name="build")
+    execute_pipeline(
+        ctx,
+        pipeline,
+        AVAILABLE_MODULES,
+        pipeline_name="build",
+        use_cache=not no_cache,
+        force=[m.strip() for m in force.split(",")] if force else None,
+    )
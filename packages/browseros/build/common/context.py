@@ -194,6 +194,7 @@ class Context:
     semantic_version: str = ""  # e.g., "0.31.0" from resources/BROWSEROS_VERSION
     release_version: str = ""  # Explicit version for release operations (overrides semantic_version)
     github_repo: str = ""  # GitHub repo for release operations (owner/repo)
+    fail_fast: bool = False  # Abort resource copies at the first failing operation
     start_time: float = 0.0
 
     # App names - will be set based on platform
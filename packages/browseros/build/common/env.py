@@ -74,6 +74,22 @@ class EnvConfig:
         """Windows depot_tools toolchain setting (0 = use system toolchain)"""
         return os.environ.get("DEPOT_TOOLS_WIN_TOOLCHAIN", "0")
 
+    @property
+    def ninja_jobs(self) -> Optional[int]:
+        """Parallel ninja jobs for autoninja (-j), overriding the CPU-based default"""
+        value = os.environ.get("BROWSEROS_NINJA_JOBS")
+        return int(value) if value else None
+
+    @property
+    def fast_deb(self) -> bool:
+        """Assemble .deb packages with tar + zstd directly instead of dpkg-deb"""
+        return os.environ.get("BROWSEROS_FAST_DEB") == "1"
+
+    @property
+    def clean_package(self) -> bool:
+        """Restage Linux packages from scratch and delete the staging trees after"""
+        return os.environ.get("BROWSEROS_CLEAN_PACKAGE") == "1"
+
     # === macOS Code Signing ===
 
     @property
@@ -96,6 +112,16 @@ class EnvConfig:
         """App-specific password for macOS notarization"""
         return os.environ.get("PROD_MACOS_NOTARIZATION_PWD")
 
+    @property
+    def macos_keychain_password(self) -> Optional[str]:
+        """Password used to unlock the signing keychain once per run"""
+        return os.environ.get("MACOS_KEYCHAIN_PWD")
+
+    @property
+    def macos_keychain_path(self) -> Optional[str]:
+        """Keychain holding the signing identity (defaults to login keychain)"""
+        return os.environ.get("MACOS_KEYCHAIN_PATH")
+
     # === Windows Code Signing ===
 
     @property
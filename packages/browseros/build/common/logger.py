@@ -4,6 +4,9 @@ Logging utilities for the build system
 Provides consistent logging with Typer output and file logging
 """
 
+import atexit
+import threading
+import time
 import typer
 from pathlib import Path
 from datetime import datetime
@@ -11,10 +14,23 @@ from datetime import datetime
 # Global log file handle
 _log_file = None
 
+# The log is written through a large buffer and flushed periodically rather
+# than after every line; errors and warnings still flush immediately.
+LOG_BUFFER_SIZE = 1 << 20
+LOG_FLUSH_INTERVAL = 10.0
+_log_lock = threading.Lock()
+_flush_stop = threading.Event()
+_flush_thread = None
+
+# Formatted timestamp of the last logged second; strftime only runs when the
+# second changes, not for every line of subprocess output
+_last_sec = 0
+_last_stamp = ""
+
 
 def _ensure_log_file():
     """Ensure log file is created with timestamp"""
-    global _log_file
+    global _log_file, _flush_thread
     if _log_file is None:
         from .paths import get_package_root
 
@@ -26,20 +42,51 @@ def _ensure_log_file():
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         log_file_path = log_dir / f"build_{timestamp}.log"
         # Open with UTF-8 encoding to handle any characters
-        _log_file = open(log_file_path, "w", encoding="utf-8")
+        _log_file = open(
+            log_file_path, "w", encoding="utf-8", buffering=LOG_BUFFER_SIZE
+        )
         _log_file.write(
             f"BrowserOS Build Log - Started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
         )
         _log_file.write("=" * 80 + "\n\n")
+
+        # One flusher serves every log file this process opens; a thread
+        # stopped by close_log_file may still be running if reopened quickly
+        _flush_stop.clear()
+        if _flush_thread is None or not _flush_thread.is_alive():
+            _flush_thread = threading.Thread(target=_flush_periodically, daemon=True)
+            _flush_thread.start()
     return _log_file
 
 
+def _flush_periodically():
+    """Background loop flushing the log every LOG_FLUSH_INTERVAL seconds"""
+    while not _flush_stop.wait(LOG_FLUSH_INTERVAL):
+        flush_log_file()
+
+
+def flush_log_file():
+    """Flush buffered log lines to disk"""
+    with _log_lock:
+        if _log_file:
+            _log_file.flush()
+
+
+# Registered once here rather than per opened file; it flushes whichever
+# log is current at exit
+atexit.register(flush_log_file)
+
+
 def _log_to_file(message: str):
     """Write message to log file with timestamp"""
+    global _last_sec, _last_stamp
     log_file = _ensure_log_file()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_file.write(f"[{timestamp}] {message}\n")
-    log_file.flush()
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _last_sec = sec
+    with _log_lock:
+        log_file.write(f"[{_last_stamp}] {message}\n")
 
 
 def log_info(message: str):
@@ -52,12 +99,14 @@ def log_warning(message: str):
     """Print warning message with color"""
     typer.secho(f"⚠️  {message}", fg=typer.colors.YELLOW)
     _log_to_file(f"WARNING: {message}")
+    flush_log_file()
 
 
 def log_error(message: str):
     """Print error message to stderr with color"""
     typer.secho(f"❌ {message}", fg=typer.colors.RED, err=True)
     _log_to_file(f"ERROR: {message}")
+    flush_log_file()
 
 
 def log_success(message: str):
@@ -76,9 +125,11 @@ def log_debug(message: str, enabled: bool = False):
 def close_log_file():
     """Close the log file if it's open"""
     global _log_file
-    if _log_file:
-        _log_file.close()
-        _log_file = None
+    _flush_stop.set()
+    with _log_lock:
+        if _log_file:
+            _log_file.close()
+            _log_file = None
 
 
 # Export all logging functions
@@ -89,5 +140,6 @@ __all__ = [
     'log_success',
     'log_debug',
     'close_log_file',
+    'flush_log_file',
     '_log_to_file',  # Internal use by utils.run_command
 ]
\ No newline at end of file
@@ -6,7 +6,7 @@ This module defines the base class for all build modules and the validation fram
 All build modules should inherit from BuildModule and implement validate() and execute().
 """
 
-from typing import List
+from typing import List, Optional
 
 
 class ValidationError(Exception):
@@ -31,6 +31,10 @@ class CommandModule:
         produces: List of artifact names this module creates (e.g., ["signed_app", "notarization_zip"])
         requires: List of artifact names this module needs (e.g., ["built_app"])
         description: Human-readable description for --list output
+        depends_on: Module names this module must wait for when they appear
+            earlier in the pipeline. None (default) waits for every earlier
+            module; an explicit list lets the module run concurrently with
+            the earlier modules it does not name.
 
     Methods:
         validate(context): Check if module can run, raise ValidationError if not
@@ -56,6 +60,21 @@ class CommandModule:
     produces: List[str] = []
     requires: List[str] = []
     description: str = "No description provided"
+    depends_on: Optional[List[str]] = None
+
+    def input_hash(self, context) -> Optional[str]:
+        """
+        Digest of everything this module's result depends on, or None
+
+        Modules that return a digest are skipped by the pipeline when their
+        last successful run recorded the same digest (see module_cache).
+        Only override this for modules whose inputs can be fingerprinted
+        cheaply and completely; the default never skips.
+
+        Args:
+            context: BuildContext object with all build state
+        """
+        return None
 
     def validate(self, context) -> None:
         """
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Input-digest stamps that let the pipeline skip unchanged modules
+
+A module opts in by returning a digest from CommandModule.input_hash().
+After a successful run the pipeline records that digest in
+root_dir/.build_cache/modules/<module>.json; the next run skips the module
+when the digest matches. Stamps record "this module's effect is present in
+the Chromium tree", so there is one stamp per module (not per digest) and
+the clean module removes them all when it resets the tree.
+
+These modules leave their edits uncommitted, so HEAD alone can't tell that
+a checkout, stash or reset threw them away. Each stamp also lists the
+tracked files that differed from HEAD after the run, and only counts while
+every one of them still does.
+"""
+
+import hashlib
+import json
+import stat
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .utils import log_warning, safe_rmtree
+
+
+def get_stamp_dir(root_dir: Path) -> Path:
+    """Directory holding the per-module stamps"""
+    return root_dir / ".build_cache" / "modules"
+
+
+def fingerprint_files(paths: Iterable[Path], *extra: str) -> str:
+    """Digest file paths, sizes and mtimes (recursing into directories)
+
+    Uses stat data rather than content so fingerprinting a patch tree is
+    a directory walk, not a full read.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        files = sorted(path.rglob("*")) if path.is_dir() else [path]
+        for file_path in files:
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+            if stat.S_ISDIR(st.st_mode):
+                continue
+            digest.update(f"{file_path}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+    for value in extra:
+        digest.update(f"{value}\n".encode())
+    return digest.hexdigest()
+
+
+def get_chromium_head(chromium_src: Path) -> Optional[str]:
+    """Commit checked out in chromium_src, or None if it can't be read"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=chromium_src,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def get_changed_paths(chromium_src: Path) -> Optional[List[str]]:
+    """Tracked files in chromium_src that differ from HEAD, or None if unreadable"""
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--name-only", "-z", "HEAD"],
+            cwd=chromium_src,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return [path for path in result.stdout.split("\0") if path]
+
+
+def read_stamp(root_dir: Path, module_name: str) -> Optional[Dict]:
+    """Stamp recorded by the last successful run of module_name"""
+    try:
+        data = json.loads((get_stamp_dir(root_dir) / f"{module_name}.json").read_text())
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_stamp(
+    root_dir: Path,
+    module_name: str,
+    digest: str,
+    version: str,
+    changed: Optional[List[str]],
+) -> None:
+    """Record a successful run; failures only cost a re-run next time
+
+    changed is get_changed_paths() after the run; a stamp without it is
+    never considered current.
+    """
+    stamp_dir = get_stamp_dir(root_dir)
+    record = {"hash": digest, "version": version, "changed": changed}
+    try:
+        stamp_dir.mkdir(parents=True, exist_ok=True)
+        (stamp_dir / f"{module_name}.json").write_text(
+            json.dumps(record, indent=2)
+        )
+    except OSError as e:
+        log_warning(f"Could not write cache stamp for {module_name}: {e}")
+
+
+def clear_stamp(root_dir: Path, module_name: str) -> None:
+    """Forget module_name's stamp (before it runs, so a failure isn't cached)"""
+    (get_stamp_dir(root_dir) / f"{module_name}.json").unlink(missing_ok=True)
+
+
+def clear_all_stamps(root_dir: Path) -> None:
+    """Forget every stamp, e.g. after the Chromium tree has been reset"""
+    stamp_dir = get_stamp_dir(root_dir)
+    if stamp_dir.exists():
+        safe_rmtree(stamp_dir)
+
+
+class StampChain:
+    """Decides, module by module, whether one pipeline run can skip work
+
+    Each cacheable module's digest also covers the Chromium checkout and the
+    digest of the cacheable module before it. Once one cacheable module
+    runs, every cacheable module after it runs too: re-applying an earlier
+    step can undo a later one's edits without changing any digest.
+    Cacheable modules must keep the default depends_on so they run in order.
+    """
+
+    def __init__(self, ctx, use_cache: bool = True):
+        self.ctx = ctx
+        self.use_cache = use_cache
+        self._previous = ""
+        self._stale = False
+        self._prefix_changed: Optional[List[str]] = None
+        self._prefix_read = False
+
+    def _chained(self, module_name: str, module) -> Optional[str]:
+        input_hash = module.input_hash(self.ctx)
+        if input_hash is None:
+            return None
+        head = get_chromium_head(self.ctx.chromium_src)
+        if head is None:
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self._previous, module_name, input_hash, self.ctx.chromium_src, head):
+            digest.update(f"{part}\n".encode())
+        return digest.hexdigest()
+
+    def digest(self, module_name: str, module) -> Optional[str]:
+        """Chained digest for module (advancing the chain), or None if uncacheable"""
+        digest = self._chained(module_name, module)
+        if digest is not None:
+            self._previous = digest
+        return digest
+
+    def skip_if_current(self, module_name: str, module) -> bool:
+        """Advance past module if its stamp is current; leave the chain alone otherwise
+
+        For skipping a pipeline's leading modules before anything runs: the
+        tree can't change in between, so its changed paths are read once.
+        """
+        if self._stale or not self.use_cache:
+            return False
+        digest = self._chained(module_name, module)
+        if digest is None:
+            return False
+        if not self._prefix_read:
+            self._prefix_changed = get_changed_paths(self.ctx.chromium_src)
+            self._prefix_read = True
+        if self._prefix_changed is None:
+            self._stale = True
+            return False
+        if not self.is_current(module_name, digest, self._prefix_changed):
+            return False
+        self._previous = digest
+        return True
+
+    def is_current(
+        self, module_name: str, digest: str, changed: Optional[List[str]] = None
+    ) -> bool:
+        """Whether module_name's stamp has this digest and its edits are intact
+
+        changed is the tree's current get_changed_paths(), read here when not
+        given. A False answer means the module is about to run, so it also
+        marks every later cacheable module as needing to run.
+        """
+        if self._stale or not self.use_cache:
+            return False
+        stamp = read_stamp(self.ctx.root_dir, module_name)
+        if stamp is None or stamp.get("hash") != digest:
+            self._stale = True
+            return False
+        if changed is None:
+            changed = get_changed_paths(self.ctx.chromium_src)
+        recorded = stamp.get("changed")
+        if recorded is None or changed is None or not set(recorded) <= set(changed):
+            log_warning(f"Edits from {module_name} are no longer in the tree")
+            self._stale = True
+            return False
+        return True
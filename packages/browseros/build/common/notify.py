@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Notification system for BrowserOS build pipeline"""
 
+import atexit
 import os
+import queue
 import threading
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, List
 
 # Slack attachment colors
 COLOR_BLUE = "#2196F3"
@@ -13,11 +16,19 @@ COLOR_RED = "#F44336"
 # Build context (set once at pipeline start)
 _build_context: Dict[str, str] = {}
 
+# Uploaded artifacts per platform/architecture, reported once when the pipeline ends
+_pending_uploads: Dict[str, List[str]] = {}
+
+
+# Footer icon per build OS
+_OS_EMOJI = {"macOS": "🍎", "Windows": "🪟", "Linux": "🐧"}
+
 
 def set_build_context(os_name: str, arch: str) -> None:
     """Set build context for all notifications"""
     _build_context["os"] = os_name
     _build_context["arch"] = arch
+    _build_context["footer"] = _format_footer()
 
 
 def _get_context_prefix() -> str:
@@ -34,54 +45,146 @@ def _get_context_footer() -> str:
     return "BrowserOS Build System"
 
 
+def _format_footer() -> str:
+    """Footer text with the OS icon, computed when the build context is set"""
+    emoji = _OS_EMOJI.get(_build_context.get("os", ""))
+    return f"{emoji} {_get_context_footer()}" if emoji else _get_context_footer()
+
+
+# Seconds to wait at interpreter exit for queued notifications to go out
+FLUSH_TIMEOUT = 10
+
+# Notifications queued within this many seconds of each other are sent as one
+# webhook post (e.g. one module's completion and the next one's start)
+COALESCE_WINDOW = 0.1
+
+# Upper bound on attachments merged into a single Slack message
+MAX_ATTACHMENTS_PER_POST = 20
+
+
 class Notifier:
-    """Fire-and-forget notification system"""
+    """Fire-and-forget notification system
+
+    Notifications are queued and sent in order by one background worker
+    thread, instead of spawning a thread per message. Back-to-back
+    notifications are merged into one post. The queue is flushed at exit so
+    the final pipeline notifications aren't lost with the process.
+    """
 
     def __init__(self):
         self.slack_webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
         self.enabled = bool(self.slack_webhook_url)
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._session = None
 
     def notify(self, event: str, message: str, details: Optional[Dict[str, Any]] = None, color: str = "#36a64f") -> None:
         """Send notification asynchronously (fire-and-forget)"""
         if not self.enabled:
             return
 
-        # Fire and forget - run in background thread
-        thread = threading.Thread(
-            target=self._send_notification,
-            args=(event, message, details, color),
-            daemon=True
-        )
-        thread.start()
-
-    def _send_notification(self, event: str, message: str, details: Optional[Dict[str, Any]], color: str) -> None:
+        self._queue.put(self._build_payload(event, message, details, color))
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._drain, daemon=True)
+                self._worker.start()
+                atexit.register(self.flush)
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> None:
+        """Wait (up to timeout seconds) for queued notifications to be sent"""
+        with self._lock:
+            worker, self._worker = self._worker, None
+            if worker is None:
+                return
+            atexit.unregister(self.flush)
+            self._queue.put(None)
+        worker.join(timeout)
+
+    def _drain(self) -> None:
+        """Worker loop: send queued notifications until the flush sentinel
+
+        After each notification, anything else queued within COALESCE_WINDOW
+        rides along as extra attachments of the same post.
+        """
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            attachments = list(item["attachments"])
+            stop = False
+            deadline = time.monotonic() + COALESCE_WINDOW
+            while len(attachments) < MAX_ATTACHMENTS_PER_POST:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    extra = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if extra is None:
+                    stop = True
+                    break
+                attachments.extend(extra["attachments"])
+
+            self._send_notification({"attachments": attachments})
+            if stop:
+                return
+
+    def _get_session(self):
+        """Pooled HTTP session so every webhook post reuses one TLS connection
+
+        Only used from the worker thread, so it needs no locking.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset({"POST"}),
+            )
+            session = requests.Session()
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry),
+            )
+            self._session = session
+        return self._session
+
+    def _build_payload(self, event: str, message: str, details: Optional[Dict[str, Any]], color: str) -> Dict[str, Any]:
+        """Build the Slack payload on the caller's thread
+
+        Done at enqueue time so the footer reflects the build context the
+        event happened in, not whatever it is when the worker gets to it.
+        """
+        # Footer text is fixed once the build context is set
+        footer = _build_context.get("footer") or _format_footer()
+
+        # Use legacy attachment format for colored sidebar
+        attachment = {
+            "color": color,
+            "mrkdwn_in": ["text", "fields"],
+            "text": f"*{event}*\n{message}",
+            "footer": footer
+        }
+
+        if details:
+            attachment["fields"] = [
+                {"title": key, "value": str(value), "short": True}
+                for key, value in details.items()
+            ]
+
+        return {"attachments": [attachment]}
+
+    def _send_notification(self, payload: Dict[str, Any]) -> None:
         """Internal method to send notification (runs in background thread)"""
         try:
-            import requests
-
-            # Build footer text
-            footer = f"🍎 {_get_context_footer()}" if _build_context.get("os") == "macOS" \
-                else f"🪟 {_get_context_footer()}" if _build_context.get("os") == "Windows" \
-                else f"🐧 {_get_context_footer()}" if _build_context.get("os") == "Linux" \
-                else _get_context_footer()
-
-            # Use legacy attachment format for colored sidebar
-            attachment = {
-                "color": color,
-                "mrkdwn_in": ["text", "fields"],
-                "text": f"*{event}*\n{message}",
-                "footer": footer
-            }
-
-            if details:
-                attachment["fields"] = [
-                    {"title": key, "value": str(value), "short": True}
-                    for key, value in details.items()
-                ]
-
-            payload = {"attachments": [attachment]}
-
-            requests.post(
+            self._get_session().post(
                 self.slack_webhook_url,
                 json=payload,
                 timeout=5  # Quick timeout for fire-and-forget
@@ -105,6 +208,24 @@ def get_notifier() -> Notifier:
     return _notifier
 
 
+def record_upload(label: str, artifact_urls: List[str]) -> None:
+    """Queue uploaded artifact URLs for the end-of-pipeline notification
+
+    Universal builds upload once per architecture; coalescing them means one
+    webhook post for all uploads instead of one per architecture.
+    """
+    _pending_uploads.setdefault(label, []).extend(artifact_urls)
+
+
+def _take_upload_fields() -> Dict[str, str]:
+    """Return one "Uploads (<label>)" field per recorded upload and reset them"""
+    fields = {
+        f"Uploads ({label})": "\n".join(urls) for label, urls in _pending_uploads.items()
+    }
+    _pending_uploads.clear()
+    return fields
+
+
 def notify_pipeline_start(pipeline_name: str, modules: list) -> None:
     """Notify that pipeline has started"""
     notifier = get_notifier()
@@ -124,7 +245,7 @@ def notify_pipeline_end(pipeline_name: str, duration: float) -> None:
     notifier.notify(
         "🏁 Pipeline Completed",
         "Build pipeline completed successfully",
-        {"Duration": f"{mins}m {secs}s"},
+        {"Duration": f"{mins}m {secs}s", **_take_upload_fields()},
         color=COLOR_GREEN
     )
 
@@ -135,7 +256,7 @@ def notify_pipeline_error(pipeline_name: str, error: str) -> None:
     notifier.notify(
         "❌ Pipeline Failed",
         "Build pipeline failed",
-        {"Error": error},
+        {"Error": error, **_take_upload_fields()},
         color=COLOR_RED
     )
 
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """Pipeline validation for BrowserOS build system"""
 
-from typing import Dict, List, Type
+from typing import List, Mapping, Type
 from .module import CommandModule
 from .utils import log_error, log_info
 
 
-def validate_pipeline(pipeline: List[str], available_modules: Dict[str, Type[CommandModule]]) -> None:
+def validate_pipeline(pipeline: List[str], available_modules: Mapping[str, Type[CommandModule]]) -> None:
     """Validate that all modules in pipeline exist in available_modules
     
     Raises SystemExit if validation fails
@@ -30,7 +30,7 @@ def validate_pipeline(pipeline: List[str], available_modules: Dict[str, Type[Com
         raise SystemExit(1)
 
 
-def show_available_modules(available_modules: Dict[str, Type[CommandModule]]) -> None:
+def show_available_modules(available_modules: Mapping[str, Type[CommandModule]]) -> None:
     """Display all available modules with descriptions, grouped by category"""
 
     # Group modules by prefix
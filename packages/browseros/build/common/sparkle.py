@@ -6,6 +6,8 @@ Uses Python cryptography library - works on macOS, Windows, and Linux.
 """
 
 import base64
+import mmap
+import os
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -79,10 +81,15 @@ def sparkle_sign_file(
         return None, 0
 
     try:
-        file_data = file_path.read_bytes()
-        file_length = len(file_data)
-
-        signature_bytes = private_key.sign(file_data)
+        # Ed25519 signs the whole message at once, so map the file instead of
+        # copying a multi-hundred-MB DMG into the Python heap
+        with open(file_path, "rb") as f:
+            file_length = os.fstat(f.fileno()).st_size
+            if file_length == 0:
+                signature_bytes = private_key.sign(b"")
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as file_data:
+                    signature_bytes = private_key.sign(file_data)
         signature_b64 = base64.b64encode(signature_bytes).decode("ascii")
 
         return signature_b64, file_length
@@ -5,30 +5,48 @@ For each feature, checks which files have modifications and creates a commit
 with the feature name and description.
 """
 
-import yaml
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
+from typing import Iterator, List, Tuple, Optional, Dict
 
 from ..apply.utils import run_git_command
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
-from ...common.utils import log_info, log_error, log_success, log_warning
+from ...common.utils import log_info, log_error, log_success, log_warning, load_config
 
 
 def load_features(features_file: Path) -> Dict:
     """Load features from YAML file."""
     try:
-        with open(features_file, "r") as f:
-            data = yaml.safe_load(f)
-            return data.get("features", {})
+        return load_config(features_file).get("features", {})
     except Exception as e:
         log_error(f"Failed to load features file: {e}")
         return {}
 
 
+# Keep each batched git command line well under Windows' 32K character limit
+GIT_ARGS_MAX_CHARS = 30000
+
+
+def batch_paths(files: List[str], max_chars: int = GIT_ARGS_MAX_CHARS) -> Iterator[List[str]]:
+    """Split paths into batches that fit on one git command line."""
+    batch: List[str] = []
+    length = 0
+    for file_path in files:
+        if batch and length + len(file_path) + 1 > max_chars:
+            yield batch
+            batch, length = [], 0
+        batch.append(file_path)
+        length += len(file_path) + 1
+    if batch:
+        yield batch
+
+
 def get_modified_files(chromium_src: Path, files: List[str]) -> List[str]:
     """Get list of files that have modifications or are untracked.
 
+    Runs a single `git status` over all existing files (batched only for
+    very long lists) instead of one git process per file.
+
     Args:
         chromium_src: Chromium source directory
         files: List of file paths to check
@@ -36,23 +54,38 @@ def get_modified_files(chromium_src: Path, files: List[str]) -> List[str]:
     Returns:
         List of file paths that have modifications
     """
-    modified = []
-
-    for file_path in files:
-        full_path = chromium_src / file_path
-
-        if not full_path.exists():
-            continue
+    existing = [str(f) for f in files if (chromium_src / f).exists()]
+    if not existing:
+        return []
 
+    changed = set()
+    for batch in batch_paths(existing):
         result = run_git_command(
-            ["git", "status", "--porcelain", str(file_path)],
+            [
+                "git",
+                "status",
+                "--porcelain",
+                "-z",
+                "--untracked-files=all",
+                "--",
+                *batch,
+            ],
             cwd=chromium_src,
         )
+        if result.returncode != 0:
+            continue
 
-        if result.returncode == 0 and result.stdout.strip():
-            modified.append(file_path)
+        # -z entries are "XY path", and renames add the original path as
+        # an extra NUL-separated field
+        entries = iter(result.stdout.split("\0"))
+        for entry in entries:
+            if len(entry) < 4:
+                continue
+            changed.add(entry[3:])
+            if entry[0] in "RC":
+                changed.add(next(entries, ""))
 
-    return modified
+    return [f for f in files if Path(f).as_posix() in changed]
 
 
 def git_add_and_commit(
@@ -68,14 +101,14 @@ def git_add_and_commit(
     Returns:
         True if commit was created successfully
     """
-    # Add all specified files
-    for file_path in files:
+    # Add all specified files, one git process (and index write) per batch
+    for batch in batch_paths([str(f) for f in files]):
         result = run_git_command(
-            ["git", "add", str(file_path)],
+            ["git", "add", "--", *batch],
             cwd=chromium_src,
         )
         if result.returncode != 0:
-            log_error(f"Failed to add file: {file_path}")
+            log_error(f"Failed to add files: {(result.stderr or '').strip()}")
             return False
 
     # Create commit
@@ -134,6 +167,13 @@ def annotate_features(
     commits_created = 0
     features_skipped = 0
 
+    # One git status for every feature's files up front; files are dropped
+    # from the set once committed so a later feature listing them skips them
+    all_files = list(
+        dict.fromkeys(f for data in features.values() for f in data.get("files", []))
+    )
+    pending = set(get_modified_files(ctx.chromium_src, all_files))
+
     for feature_name, feature_data in features.items():
         description = feature_data.get("description", feature_name)
         files = feature_data.get("files", [])
@@ -147,7 +187,7 @@ def annotate_features(
             continue
 
         # Find files with modifications
-        modified_files = get_modified_files(ctx.chromium_src, files)
+        modified_files = [f for f in files if f in pending]
 
         if not modified_files:
             log_warning(f"   No modified files ({len(files)} files checked)")
@@ -162,6 +202,7 @@ def annotate_features(
         if git_add_and_commit(ctx.chromium_src, modified_files, commit_message):
             log_success(f"   ✓ Committed {len(modified_files)} file(s)")
             commits_created += 1
+            pending.difference_update(modified_files)
         else:
             log_warning("   No changes staged, skipping commit")
             features_skipped += 1
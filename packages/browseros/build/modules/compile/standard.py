@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 """Standard single-architecture build module for BrowserOS"""
 
-import tempfile
-import shutil
-from pathlib import Path
+import os
+from typing import List
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.utils import (
@@ -38,15 +37,18 @@ class CompileModule(CommandModule):
         self._create_version_file(ctx)
 
         autoninja_cmd = "autoninja.bat" if IS_WINDOWS() else "autoninja"
-        log_info("Using default autoninja parallelism")
 
-        run_command([autoninja_cmd, "-C", ctx.out_dir, "chrome", "chromedriver"], cwd=ctx.chromium_src)
+        run_command(
+            [autoninja_cmd, *ninja_parallelism_args(ctx), "-C", ctx.out_dir, "chrome", "chromedriver"],
+            cwd=ctx.chromium_src,
+        )
 
         app_path = ctx.get_chromium_app_path()
         new_path = ctx.get_app_path()
 
         if app_path.exists() and not new_path.exists():
-            shutil.move(str(app_path), str(new_path))
+            # Same directory, so a single rename(2) rather than shutil.move's probing
+            app_path.rename(new_path)
 
         ctx.artifact_registry.add("built_app", new_path)
 
@@ -60,23 +62,50 @@ class CompileModule(CommandModule):
 
         version_content = f"MAJOR={parts[0]}\nMINOR={parts[1]}\nBUILD={parts[2]}\nPATCH={parts[3]}"
 
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
-            temp_file.write(version_content)
-            temp_path = temp_file.name
-
         chrome_version_path = join_paths(ctx.chromium_src, "chrome", "VERSION")
-        shutil.copy2(temp_path, chrome_version_path)
-        Path(temp_path).unlink()
+
+        # Leave an identical file untouched: ninja tracks its mtime, and a
+        # rewrite would trigger a needless rebuild of everything using it
+        if chrome_version_path.exists() and chrome_version_path.read_text() == version_content:
+            log_info(f"VERSION file up to date: {ctx.browseros_chromium_version}")
+            return
+
+        # Write a sibling temp file and rename it into place atomically. The
+        # temp name is fixed, so an interrupted run leaves at most one stale
+        # file, which the next run overwrites.
+        temp_path = chrome_version_path.with_suffix(".tmp")
+        try:
+            temp_path.write_text(version_content)
+            os.replace(temp_path, chrome_version_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
         log_info(f"Created VERSION file: {ctx.browseros_chromium_version}")
 
 
+def ninja_parallelism_args(ctx: Context) -> List[str]:
+    """-j/-l flags for autoninja
+
+    autoninja's local default (CPU count + 2 jobs) oversubscribes
+    hyperthreaded cores and thrashes the page cache during links, so cap
+    jobs at one below the CPU count and hold back new jobs while the load
+    average is above that. BROWSEROS_NINJA_JOBS overrides the job count.
+    """
+    jobs = ctx.env.ninja_jobs or max(1, (os.cpu_count() or 1) - 1)
+    log_info(f"Using {jobs} parallel ninja jobs")
+    return ["-j", str(jobs), "-l", str(jobs)]
+
+
 def build_target(ctx: Context, target: str) -> bool:
     """Build a specific target (e.g., mini_installer)"""
     log_info(f"\n🔨 Building target: {target}")
 
     autoninja_cmd = "autoninja.bat" if IS_WINDOWS() else "autoninja"
-    run_command([autoninja_cmd, "-C", ctx.out_dir, target], cwd=ctx.chromium_src)
+    run_command(
+        [autoninja_cmd, *ninja_parallelism_args(ctx), "-C", ctx.out_dir, target],
+        cwd=ctx.chromium_src,
+    )
 
     log_success(f"Target {target} built successfully")
     return True
@@ -83,9 +83,9 @@ class UniversalBuildModule(CommandModule):
             raise ValidationError(f"Universalizer script not found: {universalizer}")
 
         # Fail fast: check signing environment is configured
-        from ..sign.macos import check_signing_environment
+        from ..sign.macos import load_signing_env
 
-        if not check_signing_environment():
+        if load_signing_env(ctx.env) is None:
             raise ValidationError(
                 "Signing environment not configured. "
                 "Required: MACOS_CERTIFICATE_NAME, notarization credentials"
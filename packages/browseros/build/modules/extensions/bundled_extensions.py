@@ -27,6 +27,8 @@ class BundledExtensionsModule(CommandModule):
     produces = ["bundled_extensions"]
     requires = []
     description = "Download and bundle extensions from CDN update manifest"
+    # Only needs a reset checkout; can overlap other prep modules
+    depends_on = ["clean", "git_setup"]
 
     def validate(self, ctx: Context) -> None:
         if not ctx.chromium_src or not ctx.chromium_src.exists():
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 """Linux packaging module for BrowserOS (AppImage and .deb)"""
 
+import errno
+import hashlib
 import os
+import re
 import shutil
+import stat
 import subprocess
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
@@ -15,11 +24,12 @@ from ...common.utils import (
     log_warning,
     log_success,
     run_command,
-    safe_rmtree,
+    parallel_rmtree,
     join_paths,
     IS_LINUX,
 )
 from ...common.notify import get_notifier, COLOR_GREEN
+from ..resources.resources import copy_file, plan_tree_copy, run_copy_jobs
 
 
 class LinuxPackageModule(CommandModule):
@@ -45,8 +55,19 @@ class LinuxPackageModule(CommandModule):
         package_dir = ctx.get_dist_dir()
         package_dir.mkdir(parents=True, exist_ok=True)
 
-        appimage_path = self._package_appimage(ctx, package_dir)
-        deb_path = self._package_deb(ctx, package_dir)
+        # Staging trees are kept in dist/ between runs so unchanged files
+        # aren't restaged; BROWSEROS_CLEAN_PACKAGE=1 starts from scratch
+        force = ctx.env.clean_package
+        staging = join_paths(package_dir, f"{ctx.BROWSEROS_APP_BASE_NAME}_staging")
+        if force and staging.exists():
+            parallel_rmtree(staging)
+        if not stage_browser_files(ctx, staging, force=force):
+            raise RuntimeError("Failed to stage browser files for packaging")
+
+        appimage_path = self._package_appimage(ctx, package_dir, staging, force)
+        deb_path = self._package_deb(ctx, package_dir, staging, force)
+        if force:
+            parallel_rmtree(staging)
 
         if appimage_path:
             ctx.artifact_registry.add("appimage", appimage_path)
@@ -81,11 +102,15 @@ class LinuxPackageModule(CommandModule):
             color=COLOR_GREEN,
         )
 
-    def _package_appimage(self, ctx: Context, package_dir: Path) -> Optional[Path]:
-        return package_appimage(ctx, package_dir)
+    def _package_appimage(
+        self, ctx: Context, package_dir: Path, staging: Path, force: bool
+    ) -> Optional[Path]:
+        return package_appimage(ctx, package_dir, staging, force=force)
 
-    def _package_deb(self, ctx: Context, package_dir: Path) -> Optional[Path]:
-        return package_deb(ctx, package_dir)
+    def _package_deb(
+        self, ctx: Context, package_dir: Path, staging: Path, force: bool
+    ) -> Optional[Path]:
+        return package_deb(ctx, package_dir, staging, force=force)
 
 
 # =============================================================================
@@ -93,8 +118,66 @@ class LinuxPackageModule(CommandModule):
 # =============================================================================
 
 
+# os.link errors meaning "can't link here" rather than "copy failed"
+_LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP}
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hard-link src to dst, copying instead where linking isn't possible
+
+    Only for staging directories: a link shares the inode with src (and
+    ultimately the build output), so dst must never be modified in place.
+    """
+    if os.path.lexists(dst):
+        # Never let copy_file write through an existing link into src
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+        copy_file(src, dst)
+
+
+def set_file_mode(path: str, mode: int) -> None:
+    """chmod path to mode, giving it its own inode first if it is a hard link
+
+    Staged files may share their inode with the build output, whose mode
+    must not change; files that already have the mode are left alone.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return
+    if stat.S_IMODE(st.st_mode) == mode:
+        return
+    if st.st_nlink > 1:
+        private = path + ".tmp"
+        copy_file(path, private)
+        os.replace(private, path)
+    os.chmod(path, mode)
+
+
+def prune_untracked_files(target_dir: str, wanted: Set[str]) -> None:
+    """Remove files (and then empty directories) under target_dir not in wanted"""
+    for root, dirs, files in os.walk(target_dir, topdown=False):
+        for name in files:
+            path = os.path.join(root, name)
+            if path not in wanted:
+                os.unlink(path)
+        for name in dirs:
+            path = os.path.join(root, name)
+            if not os.path.islink(path) and not os.listdir(path):
+                os.rmdir(path)
+
+
 def copy_browser_files(
-    ctx: Context, target_dir: Path, set_sandbox_suid: bool = True
+    ctx: Context,
+    target_dir: Path,
+    set_sandbox_suid: bool = True,
+    prefer_link: bool = False,
+    force: bool = False,
+    source_dir: Optional[Path] = None,
 ) -> bool:
     """Copy browser binaries, libraries, and resources to target directory.
 
@@ -102,12 +185,27 @@ def copy_browser_files(
         ctx: Build context
         target_dir: Destination directory for browser files
         set_sandbox_suid: If True, set SUID bit on chrome_sandbox (AppImage only)
+        prefer_link: Hard-link files from the build output instead of copying
+            them when both are on one filesystem. The staged files then alias
+            the build output (or source_dir), so they must never be modified
+            in place; chrome_sandbox is always copied since its mode changes,
+            and set_file_mode unshares any other file whose mode it fixes.
+        force: Rewrite every file. By default files left in target_dir by a
+            previous run are kept when their size and mtime still match the
+            build output, and files the build no longer produces are removed.
+        source_dir: Directory to copy from instead of the build output, e.g.
+            the shared staging tree
 
     Returns:
         True if successful, False otherwise
     """
     target_dir.mkdir(parents=True, exist_ok=True)
-    out_dir = join_paths(ctx.chromium_src, ctx.out_dir)
+    if source_dir is None:
+        out_dir = str(join_paths(ctx.chromium_src, ctx.out_dir))
+    else:
+        out_dir = str(source_dir)
+    target = str(target_dir)
+    join = os.path.join
 
     files_to_copy = [
         ctx.BROWSEROS_APP_NAME,
@@ -127,52 +225,90 @@ def copy_browser_files(
         "resources.pak",
     ]
 
-    for file in files_to_copy:
-        src = join_paths(out_dir, file)
-        if Path(src).exists():
-            shutil.copy2(src, join_paths(target_dir, file))
-            log_info(f"  ✓ Copied {file}")
-        else:
+    dirs_to_copy = ["locales", "MEIPreload", "BrowserOSServer"]
+
+    # Plan every file (including the directory trees) first, then copy them
+    # all on one thread pool: the payload is a few large binaries plus many
+    # small .pak files, and the copies are purely I/O bound
+    jobs = []
+    copied = []
+    created_dirs = {target}
+
+    # One directory read answers every existence check below
+    files_present, dirs_present = set(), set()
+    try:
+        with os.scandir(out_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    files_present.add(entry.name)
+                elif entry.is_dir():
+                    dirs_present.add(entry.name)
+    except FileNotFoundError:
+        pass
+
+    pairs = [(file, join(out_dir, file), join(target, file)) for file in files_to_copy]
+    for file, src, dst in pairs:
+        if file in files_present:
+            jobs.append((src, dst))
+            copied.append(file)
+        elif source_dir is None:  # already reported when staging
             log_warning(f"  ⚠ File not found: {file}")
 
-    dirs_to_copy = ["locales", "MEIPreload", "BrowserOSServer"]
     for dir_name in dirs_to_copy:
-        src = join_paths(out_dir, dir_name)
-        if Path(src).exists():
-            shutil.copytree(src, join_paths(target_dir, dir_name), dirs_exist_ok=True)
-            log_info(f"  ✓ Copied {dir_name}/")
-
-    browseros_path = Path(join_paths(target_dir, ctx.BROWSEROS_APP_NAME))
-    if browseros_path.exists():
-        browseros_path.chmod(0o755)
-
-    sandbox_path = Path(join_paths(target_dir, "chrome_sandbox"))
-    if sandbox_path.exists():
-        if set_sandbox_suid:
-            sandbox_path.chmod(0o4755)
-        else:
-            sandbox_path.chmod(0o755)
-
-    crashpad_path = Path(join_paths(target_dir, "chrome_crashpad_handler"))
-    if crashpad_path.exists():
-        crashpad_path.chmod(0o755)
+        src = join(out_dir, dir_name)
+        if dir_name in dirs_present:
+            jobs.extend(plan_tree_copy(src, join(target, dir_name), created_dirs))
+            copied.append(f"{dir_name}/")
+
+    if prefer_link:
+        sandbox_dst = join(target, "chrome_sandbox")
+
+        def _stage(src: str, dst: str) -> None:
+            # The sandbox gets its own inode so its chmod can't touch the source
+            if dst == sandbox_dst:
+                copy_file(src, dst)
+            else:
+                link_or_copy(src, dst)
+
+        errors = run_copy_jobs(jobs, _stage, skip_unchanged=not force)
+    else:
+        errors = run_copy_jobs(jobs, skip_unchanged=not force)
+    if errors:
+        for index, error in errors.items():
+            log_error(f"  ✗ Failed to copy {jobs[index][0]}: {error}")
+        return False
 
-    return True
+    # Drop leftovers from a previous run that this build no longer ships
+    prune_untracked_files(target, {dst for _, dst in jobs})
 
+    for name in copied:
+        log_info(f"  ✓ Copied {name}")
 
-def create_desktop_file(apps_dir: Path, exec_path: str) -> Path:
-    """Create .desktop file with specified Exec path.
+    set_file_mode(join(target, ctx.BROWSEROS_APP_NAME), 0o755)
+    set_file_mode(
+        join(target, "chrome_sandbox"), 0o4755 if set_sandbox_suid else 0o755
+    )
+    set_file_mode(join(target, "chrome_crashpad_handler"), 0o755)
 
-    Args:
-        apps_dir: Directory where .desktop file should be created
-        exec_path: Full path for Exec= line in desktop file
+    return True
 
-    Returns:
-        Path to created .desktop file
+
+def stage_browser_files(ctx: Context, staging_dir: Path, force: bool = False) -> bool:
+    """Stage the browser payload once for both AppImage and .deb
+
+    The staging tree lives next to the packages, so the AppDir and .deb
+    trees can always hard-link from it even when the build output is on
+    another filesystem; then the payload is copied at most once.
     """
-    apps_dir.mkdir(parents=True, exist_ok=True)
+    log_info("📁 Staging browser files...")
+    return copy_browser_files(
+        ctx, staging_dir, set_sandbox_suid=False, prefer_link=True, force=force
+    )
+
 
-    desktop_content = f"""[Desktop Entry]
+def render_desktop_entry(exec_path: str) -> str:
+    """Contents of browseros.desktop launching exec_path"""
+    return f"""[Desktop Entry]
 Version=1.0
 Name=BrowserOS
 GenericName=Web Browser
@@ -186,7 +322,20 @@ Icon=browseros
 StartupWMClass=chromium-browser
 """
 
-    desktop_file = Path(join_paths(apps_dir, "browseros.desktop"))
+
+def create_desktop_file(apps_dir: Path, exec_path: str) -> Path:
+    """Create .desktop file with specified Exec path.
+
+    Args:
+        apps_dir: Existing directory where .desktop file should be created
+        exec_path: Full path for Exec= line in desktop file
+
+    Returns:
+        Path to created .desktop file
+    """
+    desktop_content = render_desktop_entry(exec_path)
+
+    desktop_file = join_paths(apps_dir, "browseros.desktop")
     desktop_file.write_text(desktop_content)
     log_info("  ✓ Created desktop file")
     return desktop_file
@@ -197,19 +346,19 @@ def copy_icon(ctx: Context, icons_dir: Path) -> bool:
 
     Args:
         ctx: Build context
-        icons_dir: Base icons directory (usr/share/icons/hicolor)
+        icons_dir: Base icons directory (usr/share/icons/hicolor), with its
+            256x256/apps subdirectory already created
 
     Returns:
         True if icon was copied, False if not found
     """
-    icon_src = Path(join_paths(ctx.root_dir, "resources", "icons", "product_logo.png"))
+    icon_src = join_paths(ctx.root_dir, "resources", "icons", "product_logo.png")
     if not icon_src.exists():
         log_warning("  ⚠ Icon not found at resources/icons/product_logo.png")
         return False
 
-    icon_dest = Path(join_paths(icons_dir, "256x256", "apps", "browseros.png"))
-    icon_dest.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(icon_src, icon_dest)
+    icon_dest = join_paths(icons_dir, "256x256", "apps", "browseros.png")
+    copy_file(str(icon_src), str(icon_dest))
     log_info("  ✓ Copied icon")
     return True
 
@@ -219,7 +368,9 @@ def copy_icon(ctx: Context, icons_dir: Path) -> bool:
 # =============================================================================
 
 
-def prepare_appdir(ctx: Context, appdir: Path) -> bool:
+def prepare_appdir(
+    ctx: Context, appdir: Path, staging: Path, force: bool = False
+) -> bool:
     """Prepare the AppDir structure for AppImage"""
     log_info("📁 Preparing AppDir structure...")
 
@@ -228,32 +379,43 @@ def prepare_appdir(ctx: Context, appdir: Path) -> bool:
     icons_dir = join_paths(usr_share, "icons", "hicolor")
     apps_dir = join_paths(usr_share, "applications")
 
-    # Copy browser files (with SUID on chrome_sandbox for AppImage)
-    if not copy_browser_files(ctx, app_root, set_sandbox_suid=True):
-        return False
-
-    # Create desktop file
-    desktop_file = create_desktop_file(
-        apps_dir, f"/opt/browseros/{ctx.BROWSEROS_APP_NAME}"
-    )
+    # Create the whole layout in one pass; the helpers below assume it exists
+    for directory in (app_root, apps_dir, join_paths(icons_dir, "256x256", "apps")):
+        os.makedirs(directory, exist_ok=True)
+
+    # The browser files, desktop file and icon touch disjoint paths, so the
+    # small metadata writes run alongside the payload copy
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Copy browser files (with SUID on chrome_sandbox for AppImage)
+        copied = executor.submit(
+            copy_browser_files,
+            ctx,
+            app_root,
+            set_sandbox_suid=True,
+            prefer_link=True,
+            force=force,
+            source_dir=staging,
+        )
+        # Create desktop file
+        desktop = executor.submit(
+            create_desktop_file, apps_dir, f"/opt/browseros/{ctx.BROWSEROS_APP_NAME}"
+        )
+        # Copy icon
+        executor.submit(copy_icon, ctx, icons_dir).result()
+        desktop.result()
+        if not copied.result():
+            return False
 
-    # Copy icon
-    icon_src = Path(join_paths(ctx.root_dir, "resources", "icons", "product_logo.png"))
-    copy_icon(ctx, icons_dir)
+    icon_src = join_paths(ctx.root_dir, "resources", "icons", "product_logo.png")
 
-    # AppImage-specific: Copy desktop file to root and update Exec line
-    appdir_desktop = Path(join_paths(appdir, "browseros.desktop"))
-    shutil.copy2(desktop_file, appdir_desktop)
-    desktop_content = appdir_desktop.read_text()
-    desktop_content = desktop_content.replace(
-        f"Exec=/opt/browseros/{ctx.BROWSEROS_APP_NAME} %U", "Exec=AppRun %U"
-    )
-    appdir_desktop.write_text(desktop_content)
+    # AppImage-specific: Desktop file at the root, launching through AppRun
+    appdir_desktop = join_paths(appdir, "browseros.desktop")
+    appdir_desktop.write_text(render_desktop_entry("AppRun"))
 
     # AppImage-specific: Copy icon to root
     if icon_src.exists():
-        appdir_icon = Path(join_paths(appdir, "browseros.png"))
-        shutil.copy2(icon_src, appdir_icon)
+        appdir_icon = join_paths(appdir, "browseros.png")
+        copy_file(str(icon_src), str(appdir_icon))
 
     # AppImage-specific: Create AppRun script
     apprun_content = f"""#!/bin/sh
@@ -264,7 +426,7 @@ export CHROME_WRAPPER="${{THIS}}"
 "${{HERE}}"/opt/browseros/{ctx.BROWSEROS_APP_NAME} "$@"
 """
 
-    apprun_file = Path(join_paths(appdir, "AppRun"))
+    apprun_file = join_paths(appdir, "AppRun")
     apprun_file.write_text(apprun_content)
     apprun_file.chmod(0o755)
     log_info("  ✓ Created AppRun script")
@@ -272,32 +434,110 @@ export CHROME_WRAPPER="${{THIS}}"
     return True
 
 
+# appimagetool paths already located/verified in this process, by root_dir
+_appimagetool_cache: Dict[Path, Path] = {}
+
+
+def _file_sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+APPIMAGETOOL_URL = "https://github.com/AppImage/AppImageKit/releases/download/continuous/appimagetool-x86_64.AppImage"
+DOWNLOAD_ATTEMPTS = 4
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def download_file(url: str, dest: Path) -> Optional[str]:
+    """Stream url into dest, retrying transient failures with backoff
+
+    The body goes to a sibling .part file that only replaces dest once it
+    is complete. Returns the SHA-256 of the download, or None on failure.
+    """
+    part_path = dest.with_name(dest.name + ".part")
+    for attempt in range(DOWNLOAD_ATTEMPTS):
+        try:
+            digest = hashlib.sha256()
+            with urllib.request.urlopen(url, timeout=60) as resp, open(
+                part_path, "wb"
+            ) as f:
+                while chunk := resp.read(DOWNLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+            os.replace(part_path, dest)
+            return digest.hexdigest()
+        except OSError as e:  # URLError, timeouts and write errors
+            part_path.unlink(missing_ok=True)
+            # 4xx (other than throttling) won't be fixed by retrying
+            permanent = isinstance(e, urllib.error.HTTPError) and (
+                e.code < 500 and e.code != 429
+            )
+            if permanent or attempt == DOWNLOAD_ATTEMPTS - 1:
+                log_error(f"Download of {url} failed: {e}")
+                return None
+            delay = 2**attempt
+            log_warning(
+                f"Download failed (attempt {attempt + 1}/{DOWNLOAD_ATTEMPTS}): {e}, "
+                f"retrying in {delay}s..."
+            )
+            time.sleep(delay)
+    return None
+
+
 def download_appimagetool(ctx: Context) -> Optional[Path]:
-    """Download appimagetool if not available"""
-    tool_dir = Path(join_paths(ctx.root_dir, "build", "tools"))
+    """Download appimagetool if not available
+
+    The digest of each download is kept in a .sha256 sidecar; a cached tool
+    that no longer matches it (e.g. a truncated download) is fetched again.
+    """
+    cached = _appimagetool_cache.get(ctx.root_dir)
+    if cached is not None:
+        return cached
+
+    tool_dir = join_paths(ctx.root_dir, "build", "tools")
     tool_dir.mkdir(exist_ok=True)
 
-    tool_path = Path(join_paths(tool_dir, "appimagetool-x86_64.AppImage"))
+    tool_path = join_paths(tool_dir, "appimagetool-x86_64.AppImage")
+    checksum_path = tool_path.with_name(tool_path.name + ".sha256")
 
     if tool_path.exists():
-        log_info("✓ appimagetool already available")
-        return tool_path
+        try:
+            recorded = checksum_path.read_text().strip()
+        except OSError:
+            recorded = None
+        if recorded == _file_sha256(tool_path):
+            log_info("✓ appimagetool already available")
+            _appimagetool_cache[ctx.root_dir] = tool_path
+            return tool_path
+        log_warning("appimagetool checksum missing or mismatched, re-downloading")
+        tool_path.unlink()
 
     log_info("📥 Downloading appimagetool...")
-    url = "https://github.com/AppImage/AppImageKit/releases/download/continuous/appimagetool-x86_64.AppImage"
+    digest = download_file(APPIMAGETOOL_URL, tool_path)
 
-    cmd = ["wget", "-O", str(tool_path), url]
-    result = run_command(cmd, check=False)
-
-    if result.returncode == 0:
+    if digest is not None:
         tool_path.chmod(0o755)
+        checksum_path.write_text(digest + "\n")
         log_success("✓ Downloaded appimagetool")
+        _appimagetool_cache[ctx.root_dir] = tool_path
         return tool_path
     else:
         log_error("Failed to download appimagetool")
         return None
 
 
+@lru_cache(maxsize=4)
+def appimage_compression(appimagetool: str) -> str:
+    """Fastest squashfs compressor this appimagetool offers (zstd, else gzip)"""
+    try:
+        result = subprocess.run(
+            [appimagetool, "--help"], capture_output=True, text=True, check=False
+        )
+    except OSError:
+        return "gzip"
+    return "zstd" if "zstd" in result.stdout + result.stderr else "gzip"
+
+
 def create_appimage(ctx: Context, appdir: Path, output_path: Path) -> bool:
     """Create AppImage from AppDir"""
     log_info("📦 Creating AppImage...")
@@ -314,7 +554,7 @@ def create_appimage(ctx: Context, appdir: Path, output_path: Path) -> bool:
     cmd = [
         str(appimagetool),
         "--comp",
-        "gzip",  # Use gzip compression
+        appimage_compression(str(appimagetool)),
         str(appdir),
         str(output_path),
     ]
@@ -323,13 +563,8 @@ def create_appimage(ctx: Context, appdir: Path, output_path: Path) -> bool:
     env = os.environ.copy()
     env["ARCH"] = arch
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        env=env,
-        check=False
-    )
+    # Stream appimagetool/mksquashfs progress to the log as it happens
+    result = run_command(cmd, env=env, check=False)
 
     if result.returncode == 0:
         log_success(f"✓ Created AppImage: {output_path}")
@@ -338,8 +573,6 @@ def create_appimage(ctx: Context, appdir: Path, output_path: Path) -> bool:
         return True
     else:
         log_error("Failed to create AppImage")
-        if result.stderr:
-            log_error(result.stderr)
         return False
 
 
@@ -349,8 +582,7 @@ def create_appimage(ctx: Context, appdir: Path, output_path: Path) -> bool:
 
 
 def create_launcher_script(ctx: Context, bin_dir: Path) -> None:
-    """Create launcher script in /usr/bin/browseros."""
-    bin_dir.mkdir(parents=True, exist_ok=True)
+    """Create launcher script in /usr/bin/browseros (bin_dir must exist)."""
 
     launcher_content = f"""#!/bin/sh
 # BrowserOS launcher script
@@ -358,15 +590,14 @@ export LD_LIBRARY_PATH=/usr/lib/browseros:$LD_LIBRARY_PATH
 exec /usr/lib/browseros/{ctx.BROWSEROS_APP_NAME} "$@"
 """
 
-    launcher_path = Path(join_paths(bin_dir, "browseros"))
+    launcher_path = join_paths(bin_dir, "browseros")
     launcher_path.write_text(launcher_content)
     launcher_path.chmod(0o755)
     log_info("  ✓ Created launcher script")
 
 
 def create_control_file(ctx: Context, debian_dir: Path) -> None:
-    """Create DEBIAN/control file with package metadata."""
-    debian_dir.mkdir(parents=True, exist_ok=True)
+    """Create DEBIAN/control file with package metadata (debian_dir must exist)."""
 
     # Version formatting: strip 'v' prefix and spaces, ensure numeric
     version = ctx.get_browseros_chromium_version()
@@ -388,7 +619,7 @@ Description: BrowserOS - The open source agentic browser
  designed for modern web browsing with AI capabilities.
 """
 
-    control_path = Path(join_paths(debian_dir, "control"))
+    control_path = join_paths(debian_dir, "control")
     control_path.write_text(control_content)
     log_info("  ✓ Created DEBIAN/control")
 
@@ -411,13 +642,15 @@ fi
 exit 0
 """
 
-    postinst_path = Path(join_paths(debian_dir, "postinst"))
+    postinst_path = join_paths(debian_dir, "postinst")
     postinst_path.write_text(postinst_content)
     postinst_path.chmod(0o755)
     log_info("  ✓ Created DEBIAN/postinst")
 
 
-def prepare_debdir(ctx: Context, debdir: Path) -> bool:
+def prepare_debdir(
+    ctx: Context, debdir: Path, staging: Path, force: bool = False
+) -> bool:
     """Prepare directory structure for .deb package.
 
     Structure:
@@ -443,39 +676,171 @@ def prepare_debdir(ctx: Context, debdir: Path) -> bool:
     icons_dir = join_paths(share_dir, "icons", "hicolor")
     debian_dir = join_paths(debdir, "DEBIAN")
 
-    # Copy browser files (without SUID, will be set in postinst)
-    if not copy_browser_files(ctx, lib_dir, set_sandbox_suid=False):
+    # Create the whole layout in one pass; the helpers below assume it exists
+    for directory in (
+        lib_dir,
+        bin_dir,
+        apps_dir,
+        join_paths(icons_dir, "256x256", "apps"),
+        debian_dir,
+    ):
+        os.makedirs(directory, exist_ok=True)
+
+    def _create_debian_metadata() -> None:
+        create_control_file(ctx, debian_dir)
+        create_postinst_script(debian_dir)
+
+    # The payload copy and the metadata writers touch disjoint paths, so
+    # the small writes run alongside the copy
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        # Copy browser files (without SUID, will be set in postinst)
+        copied = executor.submit(
+            copy_browser_files,
+            ctx,
+            lib_dir,
+            set_sandbox_suid=False,
+            prefer_link=True,
+            force=force,
+            source_dir=staging,
+        )
+        writers = [
+            # Create launcher script in /usr/bin/
+            executor.submit(create_launcher_script, ctx, bin_dir),
+            # Create desktop file
+            executor.submit(create_desktop_file, apps_dir, "/usr/bin/browseros"),
+            # Copy icon
+            executor.submit(copy_icon, ctx, icons_dir),
+            # Create DEBIAN metadata files
+            executor.submit(_create_debian_metadata),
+        ]
+        for writer in writers:
+            writer.result()
+        if not copied.result():
+            return False
+
+    log_success("✓ .deb directory prepared")
+    return True
+
+
+# First dpkg-deb release with zstd compression and --threads-max
+DPKG_ZSTD_MIN_VERSION = (1, 21, 18)
+
+
+@lru_cache(maxsize=1)
+def dpkg_deb_supports_zstd() -> bool:
+    """Whether the installed dpkg-deb can write multi-threaded zstd archives"""
+    try:
+        output = subprocess.check_output(["dpkg-deb", "--version"], text=True)
+    except (OSError, subprocess.CalledProcessError):
         return False
 
-    # Create launcher script in /usr/bin/
-    create_launcher_script(ctx, bin_dir)
+    match = re.search(r"version (\d+(?:\.\d+)*)", output)
+    if not match:
+        return False
+    version = tuple(int(part) for part in match.group(1).split("."))
+    return version >= DPKG_ZSTD_MIN_VERSION
 
-    # Create desktop file
-    create_desktop_file(apps_dir, "/usr/bin/browseros")
 
-    # Copy icon
-    copy_icon(ctx, icons_dir)
+AR_HEADER_SIZE = 60
 
-    # Create DEBIAN metadata files
-    create_control_file(ctx, debian_dir)
-    create_postinst_script(debian_dir)
 
-    log_success("✓ .deb directory prepared")
+def _ar_header(name: str, size: int, mtime: int) -> bytes:
+    """ar member header (GNU names, root-owned, mode 0644)"""
+    return f"{name + '/':<16}{mtime:<12}{0:<6}{0:<6}{100644:<8}{size:<10}`\n".encode()
+
+
+def _ar_append(out, name: str, data: bytes, mtime: int) -> None:
+    out.write(_ar_header(name, len(data), mtime))
+    out.write(data + (b"\n" if len(data) % 2 else b""))
+
+
+def _ar_append_command(out, name: str, cmd: List[str], mtime: int) -> None:
+    """Stream a command's stdout into the archive as one member
+
+    The size isn't known up front, so a placeholder header is written and
+    patched once the stream ends; nothing is buffered or written to a
+    temporary file.
+    """
+    header_pos = out.tell()
+    out.write(_ar_header(name, 0, mtime))
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    try:
+        shutil.copyfileobj(proc.stdout, out, DOWNLOAD_CHUNK_SIZE)
+    finally:
+        proc.stdout.close()
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    size = out.tell() - header_pos - AR_HEADER_SIZE
+    if size % 2:
+        out.write(b"\n")
+    end = out.tell()
+    out.seek(header_pos)
+    out.write(_ar_header(name, size, mtime))
+    out.seek(end)
+
+
+def create_deb_direct(debdir: Path, output_path: Path) -> bool:
+    """Build .deb package by streaming tar + zstd straight into the ar archive.
+
+    A .deb is an ar archive of debian-binary, control.tar.* and data.tar.*,
+    so GNU tar and zstd are enough; dpkg-deb is not needed.
+    """
+    if not (shutil.which("tar") and shutil.which("zstd")):
+        log_error("Direct .deb assembly needs GNU tar and zstd on PATH")
+        return False
+
+    tar = [
+        "tar",
+        "--use-compress-program=zstd -T0 -q",
+        "--owner=0",  # Ensure files owned by root:root
+        "--group=0",
+        "--numeric-owner",
+        "--sort=name",
+        "-cf",
+        "-",
+    ]
+    mtime = int(time.time())
+    try:
+        with open(output_path, "wb") as out:
+            out.write(b"!<arch>\n")
+            _ar_append(out, "debian-binary", b"2.0\n", mtime)
+            _ar_append_command(
+                out, "control.tar.zst", tar + ["-C", str(debdir / "DEBIAN"), "."], mtime
+            )
+            _ar_append_command(
+                out,
+                "data.tar.zst",
+                tar + ["-C", str(debdir), "--exclude=./DEBIAN", "."],
+                mtime,
+            )
+    except (OSError, subprocess.CalledProcessError) as e:
+        output_path.unlink(missing_ok=True)
+        log_error(f"Failed to create .deb package: {e}")
+        return False
+
+    log_success(f"✓ Created .deb package: {output_path}")
+    output_path.chmod(0o644)  # Standard package permissions
     return True
 
 
 def create_deb(ctx: Context, debdir: Path, output_path: Path) -> bool:
-    """Build .deb package using dpkg-deb."""
+    """Build .deb package using dpkg-deb (or create_deb_direct if BROWSEROS_FAST_DEB=1)."""
     log_info("📦 Creating .deb package...")
 
+    if ctx.env.fast_deb:
+        return create_deb_direct(debdir, output_path)
+
     # Verify dpkg-deb is available
     if not shutil.which("dpkg-deb"):
         log_error("dpkg-deb not found. Install with: sudo apt install dpkg")
         return False
 
-    cmd = [
-        "dpkg-deb",
-        "--build",
+    cmd = ["dpkg-deb", "--build"]
+    if dpkg_deb_supports_zstd():
+        # Multi-threaded zstd instead of the single-threaded xz default
+        cmd += ["-Zzstd", "--threads-max=0"]
+    cmd += [
         "--root-owner-group",  # Ensure files owned by root:root
         str(debdir),
         str(output_path),
@@ -497,27 +862,36 @@ def create_deb(ctx: Context, debdir: Path, output_path: Path) -> bool:
 # =============================================================================
 
 
-def package_appimage(ctx: Context, package_dir: Path) -> Optional[Path]:
+def package_appimage(
+    ctx: Context, package_dir: Path, staging: Path, force: bool = False
+) -> Optional[Path]:
     """Create AppImage package.
 
+    Args:
+        staging: Tree prepared by stage_browser_files
+        force: Restage every file from scratch (clean-room builds) and remove
+            the AppDir afterwards
+
     Returns:
         Path to created AppImage, or None if failed
     """
     log_info("🖼️  Building AppImage...")
 
-    appdir = Path(join_paths(package_dir, f"{ctx.BROWSEROS_APP_BASE_NAME}.AppDir"))
-    if appdir.exists():
-        safe_rmtree(appdir)
+    appdir = join_paths(package_dir, f"{ctx.BROWSEROS_APP_BASE_NAME}.AppDir")
+    # The staging tree is kept between runs so unchanged files aren't restaged
+    if force and appdir.exists():
+        parallel_rmtree(appdir)
 
-    if not prepare_appdir(ctx, appdir):
-        safe_rmtree(appdir)
+    if not prepare_appdir(ctx, appdir, staging, force=force):
+        parallel_rmtree(appdir)
         return None
 
     filename = ctx.get_artifact_name("appimage")
-    output_path = Path(join_paths(package_dir, filename))
+    output_path = join_paths(package_dir, filename)
 
     success = create_appimage(ctx, appdir, output_path)
-    safe_rmtree(appdir)
+    if force:
+        parallel_rmtree(appdir)
 
     if success:
         log_success(f"✅ AppImage created: {output_path.name}")
@@ -527,27 +901,36 @@ def package_appimage(ctx: Context, package_dir: Path) -> Optional[Path]:
     return None
 
 
-def package_deb(ctx: Context, package_dir: Path) -> Optional[Path]:
+def package_deb(
+    ctx: Context, package_dir: Path, staging: Path, force: bool = False
+) -> Optional[Path]:
     """Create .deb package.
 
+    Args:
+        staging: Tree prepared by stage_browser_files
+        force: Restage every file from scratch (clean-room builds) and remove
+            the .deb tree afterwards
+
     Returns:
         Path to created .deb, or None if failed
     """
     log_info("📦 Building .deb package...")
 
-    debdir = Path(join_paths(package_dir, f"{ctx.BROWSEROS_APP_BASE_NAME}_deb"))
-    if debdir.exists():
-        safe_rmtree(debdir)
+    debdir = join_paths(package_dir, f"{ctx.BROWSEROS_APP_BASE_NAME}_deb")
+    # The staging tree is kept between runs so unchanged files aren't restaged
+    if force and debdir.exists():
+        parallel_rmtree(debdir)
 
-    if not prepare_debdir(ctx, debdir):
-        safe_rmtree(debdir)
+    if not prepare_debdir(ctx, debdir, staging, force=force):
+        parallel_rmtree(debdir)
         return None
 
     filename = ctx.get_artifact_name("deb")
-    output_path = Path(join_paths(package_dir, filename))
+    output_path = join_paths(package_dir, filename)
 
     success = create_deb(ctx, debdir, output_path)
-    safe_rmtree(debdir)
+    if force:
+        parallel_rmtree(debdir)
 
     if success:
         log_success(f"✅ .deb package created: {output_path.name}")
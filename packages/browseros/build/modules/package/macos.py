@@ -8,6 +8,7 @@ from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.utils import run_command, log_info, log_error, log_success, IS_MACOS
 from ...common.notify import get_notifier, COLOR_GREEN
+from ..sign.macos import retry_notarytool
 
 
 class MacOSPackageModule(CommandModule):
@@ -62,10 +63,10 @@ class MacOSPackageModule(CommandModule):
     def _create_signed_notarized_dmg(
         self, app_path: Path, dmg_path: Path, pkg_dmg_path: Path, ctx: Context
     ) -> None:
-        from ..sign.macos import check_environment
+        from ..sign.macos import load_signing_env
 
-        env_ok, env_vars = check_environment()
-        if not env_ok:
+        env_vars = load_signing_env(ctx.env)
+        if env_vars is None:
             raise ValidationError("Signing environment not configured")
 
         certificate_name = env_vars["certificate_name"]
@@ -183,7 +184,7 @@ def notarize_dmg(dmg_path: Path, keychain_profile: str = "notarytool-profile") -
     try:
         # Submit for notarization
         log_info("📤 Submitting DMG for notarization (this may take a while)...")
-        result = run_command(
+        result = retry_notarytool(
             [
                 "xcrun",
                 "notarytool",
@@ -192,8 +193,7 @@ def notarize_dmg(dmg_path: Path, keychain_profile: str = "notarytool-profile") -
                 "--keychain-profile",
                 keychain_profile,
                 "--wait",
-            ],
-            check=False,
+            ]
         )
 
         log_info(result.stdout)
@@ -221,7 +221,7 @@ def notarize_dmg(dmg_path: Path, keychain_profile: str = "notarytool-profile") -
 
         # Staple the ticket
         log_info("📎 Stapling notarization ticket to DMG...")
-        result = run_command(["xcrun", "stapler", "staple", str(dmg_path)], check=False)
+        result = retry_notarytool(["xcrun", "stapler", "staple", str(dmg_path)])
 
         if result.returncode != 0:
             log_error("Failed to staple notarization ticket to DMG")
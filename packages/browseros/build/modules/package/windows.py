@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
 """Windows packaging module for BrowserOS"""
 
+import mmap
+import re
 import shutil
+import struct
+import time
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.utils import (
@@ -18,6 +26,183 @@ from ...common.utils import (
 )
 from ...common.notify import get_notifier, COLOR_GREEN
 
+try:
+    import deflate  # libdeflate bindings (optional "fast-zip" extra)
+except ImportError:
+    deflate = None
+
+# Bytes sampled from the head of the installer to estimate compressibility
+ZIP_SAMPLE_SIZE = 256 * 1024
+# Above this level-1 deflate ratio the payload is treated as incompressible
+ZIP_STORE_RATIO = 0.95
+# Slice size for CRC-32 over the mapped installer
+ZIP_CHUNK_SIZE = 1024 * 1024
+
+# target_cpu assignment in args.gn (gn allows spaces around "=")
+_TARGET_CPU_RE = re.compile(rb'target_cpu\s*=\s*"(x64|x86|arm64)"')
+
+
+@dataclass(frozen=True)
+class WindowsBuildPaths:
+    """Build outputs the Windows packaging steps use, resolved once per context"""
+    build_dir: Path
+    mini_installer: Path
+    setup_exe: Path
+
+    @classmethod
+    def from_ctx(cls, ctx: Context) -> "WindowsBuildPaths":
+        build_dir = join_paths(ctx.chromium_src, ctx.out_dir)
+        return cls(
+            build_dir=build_dir,
+            mini_installer=build_dir / "mini_installer.exe",
+            setup_exe=build_dir / "setup.exe",
+        )
+
+
+def _choose_zip_compression(path: Path) -> Tuple[int, Optional[int]]:
+    """Pick ZIP compression for a file based on a quick entropy sample
+
+    mini_installer.exe is already compressed, so deflating it again costs a
+    lot of CPU for almost no size gain. Store it when a level-1 deflate of
+    the leading bytes barely shrinks them.
+
+    Returns:
+        (compression, compresslevel) suitable for zipfile.ZipFile
+    """
+    with open(path, "rb") as f:
+        sample = f.read(ZIP_SAMPLE_SIZE)
+
+    if not sample:
+        return zipfile.ZIP_STORED, None
+
+    ratio = len(zlib.compress(sample, 1)) / len(sample)
+    if ratio > ZIP_STORE_RATIO:
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, 1
+
+
+def _dos_datetime(mtime: float) -> Tuple[int, int]:
+    """(time, date) fields of a ZIP header, as zipfile derives them"""
+    t = time.localtime(mtime)
+    dos_time = t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2
+    dos_date = max(t.tm_year - 1980, 0) << 9 | t.tm_mon << 5 | t.tm_mday
+    return dos_time, dos_date
+
+
+def _crc32(data) -> int:
+    """CRC-32 of a buffer, fed to zlib in ZIP_CHUNK_SIZE slices (no copies)"""
+    crc = 0
+    with memoryview(data) as view:
+        for offset in range(0, len(view), ZIP_CHUNK_SIZE):
+            crc = zlib.crc32(view[offset : offset + ZIP_CHUNK_SIZE], crc)
+    return crc
+
+
+def _write_single_entry_zip(
+    zip_path: Path,
+    src_path: Path,
+    arcname: str,
+    compression: int,
+    level: Optional[int],
+) -> bool:
+    """Write a one-entry ZIP straight from an mmap of the source
+
+    The CRC is computed with zlib over large slices of the mapping, and a
+    stored entry is written from the mapping itself; a deflated entry is
+    compressed by libdeflate in one call. The ZIP records are written by
+    hand around the payload.
+
+    Returns:
+        False if the entry needs ZIP64 or the file is empty; the caller
+        should then fall back to zipfile
+    """
+    st = src_path.stat()
+    if st.st_size == 0 or st.st_size >= zipfile.ZIP64_LIMIT:
+        return False
+
+    with open(src_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        crc = _crc32(data)
+        if compression == zipfile.ZIP_DEFLATED:
+            payload = deflate.deflate_compress(data, level)
+            version = 20  # deflate needs spec 2.0
+        else:
+            payload = data
+            version = 10
+        if len(payload) >= zipfile.ZIP64_LIMIT:
+            return False
+
+        name = arcname.encode("utf-8")
+        flags = 0 if name.isascii() else 0x800  # UTF-8 file name
+        dos_time, dos_date = _dos_datetime(st.st_mtime)
+        # Fields shared by the local and central headers, from "version
+        # needed" through "file name length"
+        common = (
+            version,
+            flags,
+            compression,
+            dos_time,
+            dos_date,
+            crc,
+            len(payload),
+            st.st_size,
+            len(name),
+        )
+
+        local_header = struct.pack("<4s5H3L2H", b"PK\x03\x04", *common, 0) + name
+        central_dir = (
+            struct.pack(
+                "<4s6H3L5H2L",
+                b"PK\x01\x02",
+                20,  # made by: MS-DOS/FAT attributes, spec 2.0
+                *common,
+                0,  # extra length
+                0,  # comment length
+                0,  # disk number
+                0,  # internal attributes
+                (st.st_mode & 0xFFFF) << 16,
+                0,  # local header offset
+            )
+            + name
+        )
+        central_offset = len(local_header) + len(payload)
+        end_record = struct.pack(
+            "<4s4H2LH", b"PK\x05\x06", 0, 0, 1, 1, len(central_dir), central_offset, 0
+        )
+
+        with open(zip_path, "wb") as out:
+            out.write(local_header)
+            out.write(payload)
+            out.write(central_dir)
+            out.write(end_record)
+    return True
+
+
+def write_installer_zip(zip_path: Path, src_path: Path, arcname: str) -> None:
+    """Write a ZIP holding just src_path (as arcname)
+
+    Incompressible payloads are stored; compressible ones are deflated by
+    libdeflate when the optional deflate package is installed, otherwise by
+    zipfile from an mmap of the source.
+    """
+    compression, level = _choose_zip_compression(src_path)
+    if compression == zipfile.ZIP_STORED or deflate is not None:
+        if _write_single_entry_zip(zip_path, src_path, arcname, compression, level):
+            return
+
+    with zipfile.ZipFile(zip_path, "w", compression, compresslevel=level) as zipf:
+        if src_path.stat().st_size == 0:  # mmap can't map an empty file
+            zipf.write(src_path, arcname)
+            return
+        # Hand zlib the whole mapping in one call rather than letting
+        # ZipFile.write feed it 8 KiB reads
+        info = zipfile.ZipInfo.from_file(src_path, arcname)
+        with open(src_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            zipf.writestr(info, data, compression, level)
+
 
 class WindowsPackageModule(CommandModule):
     produces = ["installer", "installer_zip"]
@@ -28,17 +213,22 @@ class WindowsPackageModule(CommandModule):
         if not IS_WINDOWS():
             raise ValidationError("Windows packaging requires Windows")
 
-        build_output_dir = join_paths(ctx.chromium_src, ctx.out_dir)
-        mini_installer_path = build_output_dir / "mini_installer.exe"
-
+        mini_installer_path = WindowsBuildPaths.from_ctx(ctx).mini_installer
         if not mini_installer_path.exists():
             raise ValidationError(f"mini_installer.exe not found: {mini_installer_path}")
 
     def execute(self, ctx: Context) -> None:
         log_info("\n📦 Creating Windows packages...")
 
-        installer_path = self._create_installer(ctx)
-        zip_path = self._create_portable_zip(ctx)
+        paths = WindowsBuildPaths.from_ctx(ctx)
+
+        # Both only read mini_installer.exe and write separate outputs; the
+        # copy and the CRC/deflate work release the GIL, so they overlap
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            installer_future = executor.submit(self._create_installer, ctx, paths)
+            zip_future = executor.submit(self._create_portable_zip, ctx, paths)
+            installer_path = installer_future.result()
+            zip_path = zip_future.result()
 
         ctx.artifact_registry.add("installer", installer_path)
         ctx.artifact_registry.add("installer_zip", zip_path)
@@ -57,10 +247,7 @@ class WindowsPackageModule(CommandModule):
             color=COLOR_GREEN,
         )
 
-    def _create_installer(self, ctx: Context) -> Path:
-        build_output_dir = join_paths(ctx.chromium_src, ctx.out_dir)
-        mini_installer_path = build_output_dir / "mini_installer.exe"
-
+    def _create_installer(self, ctx: Context, paths: WindowsBuildPaths) -> Path:
         output_dir = ctx.get_dist_dir()
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -68,16 +255,13 @@ class WindowsPackageModule(CommandModule):
         installer_path = output_dir / installer_name
 
         try:
-            shutil.copy2(mini_installer_path, installer_path)
+            shutil.copy2(paths.mini_installer, installer_path)
             log_success(f"Installer created: {installer_name}")
             return installer_path
         except Exception as e:
             raise RuntimeError(f"Failed to create installer: {e}")
 
-    def _create_portable_zip(self, ctx: Context) -> Path:
-        build_output_dir = join_paths(ctx.chromium_src, ctx.out_dir)
-        mini_installer_path = build_output_dir / "mini_installer.exe"
-
+    def _create_portable_zip(self, ctx: Context, paths: WindowsBuildPaths) -> Path:
         output_dir = ctx.get_dist_dir()
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -85,12 +269,11 @@ class WindowsPackageModule(CommandModule):
         zip_path = output_dir / zip_name
 
         try:
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                installer_name = ctx.get_artifact_name("installer")
-                zipf.write(mini_installer_path, installer_name)
+            installer_name = ctx.get_artifact_name("installer")
+            write_installer_zip(zip_path, paths.mini_installer, installer_name)
 
-                file_size = mini_installer_path.stat().st_size
-                log_info(f"Added installer to ZIP ({file_size // (1024*1024)} MB)")
+            file_size = paths.mini_installer.stat().st_size
+            log_info(f"Added installer to ZIP ({file_size // (1024*1024)} MB)")
 
             log_success(f"Installer ZIP created: {zip_name}")
             return zip_path
@@ -100,18 +283,17 @@ def build_mini_installer(ctx: Context) -> bool:
     """Build the mini_installer target if it doesn't exist"""
     log_info("\n🔨 Checking mini_installer build...")
 
-    # Get paths
-    build_output_dir = join_paths(ctx.chromium_src, ctx.out_dir)
-    mini_installer_path = build_output_dir / "mini_installer.exe"
-    setup_exe_path = build_output_dir / "setup.exe"
+    paths = WindowsBuildPaths.from_ctx(ctx)
+    has_mini_installer = paths.mini_installer.exists()
+    has_setup_exe = paths.setup_exe.exists()
 
-    if mini_installer_path.exists() and setup_exe_path.exists():
+    if has_mini_installer and has_setup_exe:
         log_info(
             "mini_installer.exe and setup.exe already exist; rebuilding to ensure freshness"
         )
-    elif setup_exe_path.exists() and not mini_installer_path.exists():
+    elif has_setup_exe:
         log_info("setup.exe exists but mini_installer.exe missing")
-    elif mini_installer_path.exists() and not setup_exe_path.exists():
+    elif has_mini_installer:
         log_info("mini_installer.exe exists but setup.exe missing")
 
     log_info("Building setup and mini_installer targets...")
@@ -130,22 +312,15 @@ def build_mini_installer(ctx: Context) -> bool:
             "mini_installer",
         ]
 
-        # Change to chromium_src directory before running (like compile.py does)
-        import os
-
-        old_cwd = os.getcwd()
-        os.chdir(ctx.chromium_src)
-
-        try:
-            run_command(cmd)
-        finally:
-            os.chdir(old_cwd)
+        # Run from chromium_src like compile.py does; passing cwd leaves the
+        # process directory alone for other threads
+        run_command(cmd, cwd=ctx.chromium_src)
 
         # Verify the file was created
         missing_artifacts = []
-        if not setup_exe_path.exists():
+        if not paths.setup_exe.exists():
             missing_artifacts.append("setup.exe")
-        if not mini_installer_path.exists():
+        if not paths.mini_installer.exists():
             missing_artifacts.append("mini_installer.exe")
 
         if not missing_artifacts:
@@ -167,9 +342,7 @@ def create_installer(ctx: Context) -> bool:
     """Create Windows installer (mini_installer.exe)"""
     log_info("\n🔧 Creating Windows installer...")
 
-    # Get paths
-    build_output_dir = join_paths(ctx.chromium_src, ctx.out_dir)
-    mini_installer_path = build_output_dir / "mini_installer.exe"
+    mini_installer_path = WindowsBuildPaths.from_ctx(ctx).mini_installer
 
     if not mini_installer_path.exists():
         log_warning(f"mini_installer.exe not found at: {mini_installer_path}")
@@ -200,9 +373,7 @@ def create_portable_zip(ctx: Context) -> bool:
     """Create ZIP of just the installer for easier distribution"""
     log_info("\n📦 Creating installer ZIP package...")
 
-    # Get paths
-    build_output_dir = join_paths(ctx.chromium_src, ctx.out_dir)
-    mini_installer_path = build_output_dir / "mini_installer.exe"
+    mini_installer_path = WindowsBuildPaths.from_ctx(ctx).mini_installer
 
     if not mini_installer_path.exists():
         log_warning(f"mini_installer.exe not found at: {mini_installer_path}")
@@ -221,14 +392,13 @@ def create_portable_zip(ctx: Context) -> bool:
 
     # Create ZIP file containing just the installer
     try:
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Add mini_installer.exe to the zip
-            installer_name = ctx.get_artifact_name("installer")
-            zipf.write(mini_installer_path, installer_name)
+        # Add mini_installer.exe to the zip
+        installer_name = ctx.get_artifact_name("installer")
+        write_installer_zip(zip_path, mini_installer_path, installer_name)
 
-            # Get file size for logging
-            file_size = mini_installer_path.stat().st_size
-            log_info(f"Added installer to ZIP ({file_size // (1024*1024)} MB)")
+        # Get file size for logging
+        file_size = mini_installer_path.stat().st_size
+        log_info(f"Added installer to ZIP ({file_size // (1024*1024)} MB)")
 
         log_success(f"Installer ZIP created: {zip_name}")
         return True
@@ -251,6 +421,7 @@ def package_universal(contexts: List[Context]) -> bool:
     return True
 
 
+@lru_cache(maxsize=None)
 def get_target_cpu(build_output_dir: Path) -> str:
     """Get target CPU architecture from build configuration"""
     args_gn_path = build_output_dir / "args.gn"
@@ -259,11 +430,14 @@ def get_target_cpu(build_output_dir: Path) -> str:
         return "x64"  # Default
 
     try:
-        args_gn_content = args_gn_path.read_text(encoding="utf-8")
-        for cpu in ("x64", "x86", "arm64"):
-            if f'target_cpu="{cpu}"' in args_gn_content:
-                return cpu
-    except Exception:
+        # Match the ASCII token on the raw bytes; no need to decode the file
+        with open(args_gn_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            match = _TARGET_CPU_RE.search(data)
+            if match:
+                return match.group(1).decode("ascii")
+    except Exception:  # includes mmap's ValueError for an empty file
         pass
 
     return "x64"  # Default
@@ -2,18 +2,28 @@
 """Patch management module for BrowserOS build system"""
 
 import shutil
+from functools import lru_cache
+from typing import Optional
+
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
+from ...common.module_cache import fingerprint_files
 from ...common.utils import log_info, log_error
 
 
+@lru_cache(maxsize=1)
+def _git_path() -> Optional[str]:
+    """Locate git once per process; PATH scans are slow on Windows"""
+    return shutil.which("git")
+
+
 class PatchesModule(CommandModule):
     produces = []
     requires = []
     description = "Apply BrowserOS patches to Chromium"
 
     def validate(self, ctx: Context) -> None:
-        if not shutil.which("git"):
+        if not _git_path():
             raise ValidationError(
                 "Git is not available in PATH - required for applying patches"
             )
@@ -22,6 +32,9 @@ class PatchesModule(CommandModule):
         if not patches_dir.exists():
             raise ValidationError(f"Patches directory not found: {patches_dir}")
 
+    def input_hash(self, ctx: Context) -> Optional[str]:
+        return fingerprint_files([ctx.get_patches_dir()])
+
     def execute(self, ctx: Context) -> None:
         log_info("\n🩹 Applying patches...")
         if not apply_patches_impl(ctx, interactive=False):
@@ -40,7 +53,7 @@ def apply_patches_impl(ctx: Context, interactive: bool = False) -> bool:
     log_info("\n🩹 Applying patches using dev CLI system...")
 
     # Check if git is available
-    if not shutil.which("git"):
+    if not _git_path():
         log_error("Git is not available in PATH")
         log_error("Please install Git to apply patches")
         raise RuntimeError("Git not found in PATH")
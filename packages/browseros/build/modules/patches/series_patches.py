@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Series-based patch module for BrowserOS build system (GNU Quilt format)"""
 
-import shutil
 import subprocess
 from pathlib import Path
 from typing import Iterator
@@ -9,6 +8,7 @@ from typing import Iterator
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.utils import log_info, log_success, log_error, get_platform
+from .patches import _git_path
 
 
 ENCODING = "UTF-8"
@@ -20,7 +20,7 @@ class SeriesPatchesModule(CommandModule):
     description = "Apply series-based patches (GNU Quilt format)"
 
     def validate(self, ctx: Context) -> None:
-        if not shutil.which("git"):
+        if not _git_path():
             raise ValidationError("Git is not available in PATH")
 
         series_dir = ctx.get_series_patches_dir()
@@ -108,10 +108,12 @@ def apply_single_patch(patch_path: Path, chromium_src: Path) -> tuple[bool, str]
         str(patch_path)
     ]
 
+    # Success is the common case: discard stdout and keep only stderr
     result = subprocess.run(
         cmd,
         cwd=chromium_src,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True
     )
 
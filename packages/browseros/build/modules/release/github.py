@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """GitHub module - Create GitHub releases from R2 artifacts"""
 
+import os
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
@@ -20,6 +26,25 @@ from .common import (
     check_gh_cli,
 )
 
+# Concurrent artifact transfers; each is network-bound, so one stream per
+# artifact fills the link far better than a single sequential loop
+TRANSFER_WORKERS = 8
+
+
+@lru_cache(maxsize=None)
+def _http_session() -> requests.Session:
+    """Pooled session shared by every artifact transfer
+
+    Keeps one kept-alive connection per worker to R2 and to GitHub's
+    upload host, so later transfers skip the TCP and TLS handshakes.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=2, pool_maxsize=TRANSFER_WORKERS),
+    )
+    return session
+
 
 def create_github_release(
     version: str,
@@ -53,32 +78,142 @@ def create_github_release(
         return False, e.stderr
 
 
+def _preallocate(f, length: Optional[str]) -> None:
+    """Reserve the file's extents up front so the write doesn't grow it piecemeal
+
+    Best effort: skipped without a length or where the platform or
+    filesystem has no posix_fallocate.
+    """
+    if not length or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, int(length))
+    except (OSError, ValueError):
+        pass
+
+
 def download_file(url: str, dest: Path) -> bool:
-    """Download file from URL using curl"""
+    """Download file from URL over the shared session"""
     try:
-        subprocess.run(
-            ["curl", "-L", "-o", str(dest), url],
-            check=True,
-            capture_output=True,
-        )
+        with _http_session().get(
+            url, stream=True, timeout=60, headers={"Accept-Encoding": "identity"}
+        ) as response:
+            response.raise_for_status()
+            with open(dest, "wb") as f:
+                _preallocate(f, response.headers.get("Content-Length"))
+                # iter_content, unlike reading response.raw, turns truncated
+                # bodies and mid-transfer resets into RequestExceptions
+                for chunk in response.iter_content(1 << 20):
+                    f.write(chunk)
         return True
-    except Exception:
+    except (requests.RequestException, OSError):
         return False
 
 
-def upload_to_github_release(version: str, repo: str, file_path: Path) -> bool:
-    """Upload file to existing GitHub release"""
+def upload_to_github_release(
+    version: str, repo: str, file_paths: List[Path], clobber: bool = False
+) -> bool:
+    """Upload files to existing GitHub release in one gh invocation"""
+    cmd = ["gh", "release", "upload", f"v{version}", *map(str, file_paths)]
+    cmd += ["--repo", repo]
+    if clobber:
+        cmd.append("--clobber")
     try:
-        subprocess.run(
-            ["gh", "release", "upload", f"v{version}", str(file_path), "--repo", repo],
-            check=True,
-            capture_output=True,
-        )
+        subprocess.run(cmd, check=True, capture_output=True)
         return True
     except Exception:
         return False
 
 
+def get_release_upload_target(version: str, repo: str) -> Optional[Tuple[str, str]]:
+    """(asset upload URL, API token) for a release, via the gh CLI
+
+    gh release view also resolves draft releases, which the REST
+    /releases/tags endpoint does not.
+    """
+    try:
+        upload_url = subprocess.run(
+            [
+                "gh",
+                "release",
+                "view",
+                f"v{version}",
+                "--repo",
+                repo,
+                "--json",
+                "uploadUrl",
+                "--jq",
+                ".uploadUrl",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        token = subprocess.run(
+            ["gh", "auth", "token"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+    if not upload_url or not token:
+        return None
+    # Drop the URI template suffix, e.g. ".../assets{?name,label}"
+    return upload_url.split("{", 1)[0], token
+
+
+class _SizedStream:
+    """File-like wrapper giving requests the body length up front
+
+    GitHub's asset upload needs a Content-Length; without __len__ requests
+    would fall back to chunked transfer encoding.
+    """
+
+    def __init__(self, raw, length: int):
+        self._raw = raw
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        return self._raw.read(size)
+
+
+def stream_to_github_release(
+    url: str, filename: str, upload_url: str, token: str
+) -> Tuple[bool, Optional[int]]:
+    """Copy an artifact from url into a release asset, socket to socket
+
+    Returns:
+        (success, HTTP status of the failing request, or None if the
+        transfer failed without one)
+    """
+    try:
+        session = _http_session()
+        with session.get(
+            url, stream=True, timeout=60, headers={"Accept-Encoding": "identity"}
+        ) as download:
+            if download.status_code != 200:
+                return False, download.status_code
+            length = download.headers.get("Content-Length")
+            if length is None:
+                return False, None
+
+            upload = session.post(
+                upload_url,
+                params={"name": filename},
+                data=_SizedStream(download.raw, int(length)),
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Accept": "application/vnd.github+json",
+                    "Content-Type": "application/octet-stream",
+                },
+                timeout=60,
+            )
+    except requests.RequestException:
+        return False, None
+    return upload.status_code == 201, upload.status_code
+
+
 def normalize_version(version: str) -> str:
     """Normalize version to MAJOR.MINOR.BUILD (strip patch if present)"""
     parts = version.split(".")
@@ -87,45 +222,91 @@ def normalize_version(version: str) -> str:
     return version
 
 
+def _transfer_artifact(
+    url: str,
+    filename: str,
+    target: Optional[Tuple[str, str]],
+    tmppath: Path,
+) -> Union[bool, Path]:
+    """Move one artifact into the release, streaming when possible
+
+    Returns:
+        True/False once the artifact is settled, or the downloaded local
+        path when it still has to be uploaded from disk
+    """
+    if target:
+        log_info(f"  Transferring {filename}...")
+        ok, status = stream_to_github_release(url, filename, *target)
+        if ok:
+            log_success(f"  Uploaded {filename}")
+            return True
+        if status is not None and status < 500:
+            log_error(f"  Failed to upload {filename} (HTTP {status})")
+            return False
+        log_warning(f"  Streaming {filename} failed, retrying via disk")
+
+    local_path = tmppath / filename
+    log_info(f"  Downloading {filename}...")
+    if not download_file(url, local_path):
+        log_error(f"  Failed to download {filename}")
+        return False
+    return local_path
+
+
 def download_and_upload_artifacts(
     version: str,
     repo: str,
     metadata: Dict[str, Dict],
     platforms: Optional[List[str]] = None,
 ) -> List[Tuple[str, bool]]:
-    """Download artifacts from R2 and upload to GitHub release"""
+    """Download artifacts from R2 and upload to GitHub release
+
+    Artifacts are transferred concurrently; results keep platform order.
+    Any that can't be streamed are downloaded and then uploaded together
+    by a single gh invocation.
+    """
     if platforms is None:
         platforms = PLATFORMS
 
-    results = []
+    artifacts = [
+        (artifact["url"], artifact["filename"])
+        for platform in platforms
+        if platform in metadata
+        for artifact in metadata[platform].get("artifacts", {}).values()
+    ]
+    if not artifacts:
+        return []
+
+    target = get_release_upload_target(version, repo)
 
     with tempfile.TemporaryDirectory() as tmpdir:
         tmppath = Path(tmpdir)
 
-        for platform in platforms:
-            if platform not in metadata:
-                continue
-
-            for key, artifact in metadata[platform].get("artifacts", {}).items():
-                url = artifact["url"]
-                filename = artifact["filename"]
-                local_path = tmppath / filename
-
-                log_info(f"  Downloading {filename}...")
-                if not download_file(url, local_path):
-                    log_error(f"  Failed to download {filename}")
-                    results.append((filename, False))
-                    continue
-
-                log_info(f"  Uploading {filename}...")
-                if upload_to_github_release(version, repo, local_path):
-                    log_success(f"  Uploaded {filename}")
-                    results.append((filename, True))
+        def _transfer(task: Tuple[str, str]) -> Union[bool, Path]:
+            url, filename = task
+            return _transfer_artifact(url, filename, target, tmppath)
+
+        workers = min(TRANSFER_WORKERS, len(artifacts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_transfer, artifacts))
+
+        local_paths = [o for o in outcomes if isinstance(o, Path)]
+        if local_paths:
+            names = ", ".join(p.name for p in local_paths)
+            log_info(f"  Uploading {names}...")
+            # --clobber replaces partial assets left by failed streams and
+            # spares gh a per-file existence check
+            uploaded = upload_to_github_release(
+                version, repo, local_paths, clobber=True
+            )
+            for path in local_paths:
+                if uploaded:
+                    log_success(f"  Uploaded {path.name}")
                 else:
-                    log_error(f"  Failed to upload {filename}")
-                    results.append((filename, False))
+                    log_error(f"  Failed to upload {path.name}")
+            outcomes = [uploaded if isinstance(o, Path) else o for o in outcomes]
 
-    return results
+    return [(filename, ok) for (_, filename), ok in zip(artifacts, outcomes)]
 
 
 class GithubModule(CommandModule):
@@ -3,8 +3,10 @@
 
 import shutil
 from pathlib import Path
+from typing import Optional
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
+from ...common.module_cache import fingerprint_files
 from ...common.utils import log_info, log_success, log_error
 
 
@@ -17,6 +19,11 @@ class ChromiumReplaceModule(CommandModule):
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
 
+    def input_hash(self, ctx: Context) -> Optional[str]:
+        return fingerprint_files(
+            [ctx.get_chromium_replace_files_dir()], ctx.build_type
+        )
+
     def execute(self, ctx: Context) -> None:
         log_info("\n🔄 Replacing chromium files...")
         if not replace_chromium_files_impl(ctx):
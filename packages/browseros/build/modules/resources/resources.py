@@ -1,15 +1,55 @@
 #!/usr/bin/env python3
 """Resource management module for BrowserOS build system"""
 
+import errno
+import filecmp
+import fnmatch
 import glob
+import os
+import re
 import shutil
+import stat
 import yaml
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.utils import log_info, log_success, log_error, log_warning, get_platform
 
+# Parsed copy operations keyed by (path, mtime_ns) so repeated runs skip YAML parsing
+_config_cache: Dict[Tuple[str, int], Optional[List[Dict]]] = {}
+
+# libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Upper bound on concurrent file copies; copies are I/O bound so threads suffice
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Copy jobs handed to a worker per task; most resources are small icons, so
+# batching amortizes executor hand-off the way io_uring batches submissions
+COPY_BATCH_SIZE = 16
+
+# Errors from copy_file_range/FICLONE that mean "unsupported here", not "copy failed"
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+}
+
+# Linux ioctl that makes the destination share the source's extents (reflink)
+FICLONE = 0x40049409
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 
 class ResourcesModule(CommandModule):
     produces = []
@@ -27,8 +67,74 @@ class ResourcesModule(CommandModule):
             raise RuntimeError("Failed to copy resources")
 
 
+class _CopyOp(NamedTuple):
+    """A copy operation from the config with its paths resolved"""
+
+    source: str
+    destination: str
+    src_path: str
+    dst_base: str
+
+
+@dataclass
+class _PlanState:
+    """Caches shared by the planners during one copy_resources_impl run"""
+
+    # Directory listings shared by all "files" operations
+    dir_listings: Dict[str, List[str]] = field(default_factory=dict)
+    # Destination directories already created
+    created_dirs: Set[str] = field(default_factory=set)
+
+
+# A planner returns (jobs, summary), or (None, warning) if there is nothing to copy
+_PlanResult = Tuple[Optional[List[Tuple[str, str]]], str]
+
+
+def _plan_directory(op: _CopyOp, state: _PlanState) -> _PlanResult:
+    """Copy entire directory"""
+    if not stat.S_ISDIR(_stat_mode(op.src_path)):
+        return None, f"source directory not found: {op.source}"
+    jobs = plan_tree_copy(op.src_path, op.dst_base, state.created_dirs)
+    return jobs, f"Copied directory: {op.source} → {op.destination}"
+
+
+def _plan_files(op: _CopyOp, state: _PlanState) -> _PlanResult:
+    """Copy files matching pattern"""
+    files = find_matching_files(op.src_path, state.dir_listings)
+    if not files:
+        return None, f"no files found matching: {op.source}"
+    ensure_dir(op.dst_base, state.created_dirs)
+    join, basename = os.path.join, os.path.basename
+    jobs = [(f, join(op.dst_base, basename(f))) for f in files]
+    return jobs, f"Copied {len(files)} files: {op.source} → {op.destination}"
+
+
+def _plan_file(op: _CopyOp, state: _PlanState) -> _PlanResult:
+    """Copy single file"""
+    if not stat.S_ISREG(_stat_mode(op.src_path)):
+        return None, f"source file not found: {op.source}"
+    ensure_dir(os.path.dirname(op.dst_base), state.created_dirs)
+    return [(op.src_path, op.dst_base)], f"Copied file: {op.source} → {op.destination}"
+
+
+# Planner for each operation "type", resolved once per operation
+_PLANNERS: Dict[str, Callable[[_CopyOp, _PlanState], _PlanResult]] = {
+    "directory": _plan_directory,
+    "files": _plan_files,
+    "file": _plan_file,
+}
+
+
 def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
-    """Copy AI extensions and icons based on YAML configuration"""
+    """Copy AI extensions and icons based on YAML configuration
+
+    A failing operation is logged and the others still run; nothing is
+    committed if any failed. With ctx.fail_fast the copy instead stops at
+    the first failure.
+
+    Returns:
+        False if ctx.fail_fast is set and an operation failed, else True
+    """
     log_info("\n📦 Copying resources...")
 
     # Load copy configuration
@@ -39,20 +145,38 @@ def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
             f"Copy configuration file not found: {copy_config_path}"
         )
 
-    with open(copy_config_path, "r") as f:
-        config = yaml.safe_load(f)
+    copy_operations = _load_copy_operations(copy_config_path)
 
-    if "copy_operations" not in config:
+    if copy_operations is None:
         log_info("⚠️  No copy_operations defined in configuration")
         return True
 
     if commit_each:
         log_info(
-            "📝 Git commit mode enabled - will create a commit after each resource copy"
+            "📝 Git commit mode enabled - will commit copied resources at the end"
         )
 
-    # Process each copy operation
-    for operation in config["copy_operations"]:
+    # Directory listings and created directories shared across operations
+    state = _PlanState()
+    # Copy jobs from every operation, executed together on one thread pool
+    jobs: List[Tuple[str, str]] = []
+    # (name, summary, first job index, job count) for each planned operation
+    planned: List[Tuple[str, str, int, int]] = []
+    # Progress lines, emitted in one batch instead of one log call per line
+    report: List[str] = []
+    # Operations that failed; a partial result is never committed
+    failed_count = 0
+    fail_fast = ctx.fail_fast
+
+    # Loop-invariant context values, read once instead of per operation
+    root_dir = os.fspath(ctx.root_dir)
+    chromium_src = os.fspath(ctx.chromium_src)
+    build_type = ctx.build_type
+    architecture = ctx.architecture
+    current_os = get_platform()
+
+    # Resolve each copy operation into file copy jobs
+    for operation in copy_operations:
         name = operation.get("name", "Unnamed operation")
         source = operation["source"]
         destination = operation["destination"]
@@ -62,123 +186,380 @@ def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
         arch_condition = operation.get("arch")
 
         # Skip operation if build_type condition doesn't match
-        if build_type_condition and build_type_condition != ctx.build_type:
-            log_info(
-                f"  ⏭️  Skipping {name} (build_type: {build_type_condition}, current: {ctx.build_type})"
+        if build_type_condition and build_type_condition != build_type:
+            report.append(
+                f"  ⏭️  Skipping {name} (build_type: {build_type_condition}, current: {build_type})"
             )
             continue
 
         # Skip operation if os condition doesn't match
         if os_condition:
-            current_os = get_platform()
             if current_os not in os_condition:
-                log_info(
+                report.append(
                     f"  ⏭️  Skipping {name} (os: {os_condition}, current: {current_os})"
                 )
                 continue
 
         # Skip operation if arch condition doesn't match
         if arch_condition:
-            if ctx.architecture not in arch_condition:
-                log_info(
-                    f"  ⏭️  Skipping {name} (arch: {arch_condition}, current: {ctx.architecture})"
+            if architecture not in arch_condition:
+                report.append(
+                    f"  ⏭️  Skipping {name} (arch: {arch_condition}, current: {architecture})"
                 )
                 continue
 
-        # Resolve paths
-        src_path = ctx.root_dir / source
-        dst_base = ctx.chromium_src / destination
+        # Resolve paths as strings; everything downstream works on str
+        src_path = os.path.join(root_dir, source)
+        dst_base = os.path.join(chromium_src, destination)
 
-        log_info(f"  • {name}")
+        planner = _PLANNERS.get(op_type)
+        if planner is None:
+            continue
 
         try:
-            if op_type == "directory":
-                # Copy entire directory
-                if src_path.exists() and src_path.is_dir():
-                    dst_path = dst_base
-                    dst_path.mkdir(parents=True, exist_ok=True)
-                    shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
-                    log_info(f"    ✓ Copied directory: {source} → {destination}")
-                    if commit_each:
-                        commit_resource_copy(
-                            name, source, destination, ctx.chromium_src
-                        )
-                else:
-                    log_warning(f"    Source directory not found: {source}")
-
-            elif op_type == "files":
-                # Copy files matching pattern
-                files = glob.glob(str(ctx.root_dir / source))
-                if files:
-                    dst_base.mkdir(parents=True, exist_ok=True)
-                    for file_path in files:
-                        file_path = Path(file_path)
-                        if file_path.is_file():
-                            shutil.copy2(file_path, dst_base)
-                    log_info(
-                        f"    ✓ Copied {len(files)} files: {source} → {destination}"
-                    )
-                    if commit_each:
-                        commit_resource_copy(
-                            name, source, destination, ctx.chromium_src
-                        )
-                else:
-                    log_warning(f"    No files found matching: {source}")
-
-            elif op_type == "file":
-                # Copy single file
-                if src_path.exists() and src_path.is_file():
-                    dst_base.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src_path, dst_base)
-                    log_info(f"    ✓ Copied file: {source} → {destination}")
-                    if commit_each:
-                        commit_resource_copy(
-                            name, source, destination, ctx.chromium_src
-                        )
-                else:
-                    log_warning(f"    Source file not found: {source}")
-
+            op_jobs, message = planner(
+                _CopyOp(source, destination, src_path, dst_base), state
+            )
         except Exception as e:
-            log_error(f"    Error: {e}")
+            log_error(f"  • {name}: error: {e}")
+            if fail_fast:
+                log_error("Resource copy aborted before copying any files")
+                return False
+            failed_count += 1
+            continue
+
+        if op_jobs is None:
+            log_warning(f"  • {name}: {message}")
+            continue
+
+        planned.append((name, message, len(jobs), len(op_jobs)))
+        jobs.extend(op_jobs)
+
+    if report:
+        log_info("\n".join(report))
+        report.clear()
+
+    errors = run_copy_jobs(jobs, stop_on_error=fail_fast)
+
+    # Names of operations and destination files that should be committed
+    copied_names = []
+    copied_files: List[str] = []
+
+    if errors and fail_fast:
+        # Report the failure and skip logging/committing partial results
+        first = min(errors)
+        failed_ops = [
+            name
+            for name, _, start, count in planned
+            if any(start <= i < start + count for i in errors)
+        ]
+        log_error(f"  • {failed_ops[0]}: {errors[first]}")
+        log_error(
+            f"Resource copy aborted: {len(errors)} file(s) failed in "
+            f"{len(failed_ops)} operation(s): {', '.join(failed_ops)}"
+        )
+        return False
+
+    for name, summary, start, count in planned:
+        op_errors = [errors[i] for i in range(start, start + count) if i in errors]
+        if op_errors:
+            for e in op_errors:
+                log_error(f"  • {name}: {e}")
+            failed_count += 1
+            continue
+        report.append(f"  • {name}\n    ✓ {summary}")
+        copied_names.append(name)
+        copied_files.extend(dst for _, dst in jobs[start : start + count])
+
+    if report:
+        log_info("\n".join(report))
+
+    if failed_count:
+        log_error(f"{failed_count} resource operation(s) failed")
+        if commit_each:
+            log_warning("Skipping resource commit because of the failures above")
+        return True
+
+    if commit_each and copied_names:
+        commit_resource_copies(copied_names, copied_files, ctx.chromium_src)
 
     log_success("Resources copied")
     return True
 
 
-def commit_resource_copy(
-    name: str, source: str, destination: str, chromium_src: Path
+def _stat_mode(path: str) -> int:
+    """Return st_mode for path (following symlinks), or 0 if it doesn't exist"""
+    try:
+        return os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone src into dst with FICLONE; False if the filesystem can't"""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+            return False
+        raise
+
+
+def copy_file(src: str, dst: str) -> None:
+    """Copy a file's data and metadata, preferring in-kernel copies
+
+    On copy-on-write filesystems (btrfs, xfs) the destination is reflinked,
+    so no data is copied until either side is modified. Otherwise
+    copy_file_range keeps the data in the kernel. Hard links are avoided on
+    purpose: later build steps rewrite files in chromium_src in place and
+    would silently modify the originals under resources/. Where neither
+    call is supported this falls back to shutil.copy2, which itself uses
+    sendfile (Linux) or fcopyfile (macOS).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                if not _reflink(fsrc.fileno(), fdst.fileno()):
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            fsrc.fileno(), fdst.fileno(), remaining
+                        )
+                        if copied == 0:
+                            break
+                        remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                raise
+
+    shutil.copy2(src, dst)
+
+
+def is_up_to_date(src: str, dst: str) -> bool:
+    """Check whether dst already holds the same content as src
+
+    Files with matching type, size and mtime (copy_file preserves mtime) are
+    treated as identical without reading them; otherwise the contents are
+    compared. Incremental builds therefore skip rewriting unchanged files.
+    """
+    try:
+        return filecmp.cmp(src, dst, shallow=True)
+    except OSError:
+        return False
+
+
+def ensure_dir(path: str, created_dirs: Set[str]) -> None:
+    """Create a directory (and parents) unless this run already did"""
+    if path not in created_dirs:
+        os.makedirs(path, exist_ok=True)
+        created_dirs.add(path)
+
+
+def plan_tree_copy(
+    src_dir: str, dst_dir: str, created_dirs: Set[str]
+) -> List[Tuple[str, str]]:
+    """Plan a directory tree copy as a list of (src, dst) file jobs
+
+    Mirrors shutil.copytree(..., dirs_exist_ok=True): destination
+    directories are created up front so the returned jobs can be run
+    concurrently by run_copy_jobs.
+    """
+    join = os.path.join
+
+    jobs = []
+    for root, _dirs, files in os.walk(src_dir, followlinks=True):
+        rel = os.path.relpath(root, src_dir)
+        target = dst_dir if rel == os.curdir else join(dst_dir, rel)
+        ensure_dir(target, created_dirs)
+        jobs.extend((join(root, name), join(target, name)) for name in files)
+    return jobs
+
+
+def run_copy_jobs(
+    jobs: List[Tuple[str, str]],
+    copy: Callable[[str, str], None] = copy_file,
+    skip_unchanged: bool = True,
+    stop_on_error: bool = True,
+) -> Dict[int, Exception]:
+    """Run (src, dst) copy jobs from all operations on one thread pool
+
+    When several jobs target the same destination only the last one runs,
+    preserving the sequential "later operation wins" behaviour. With
+    stop_on_error the first failing job stops the run: workers finish the
+    file in hand and skip the rest. copy performs a single job (copy_file unless overridden);
+    jobs whose destination is_up_to_date are skipped unless skip_unchanged
+    is False.
+
+    Returns:
+        Mapping of job index to the exception raised by that job
+    """
+    if not jobs:
+        return {}
+
+    last_writer = {os.path.normcase(dst): i for i, (_, dst) in enumerate(jobs)}
+    indices = sorted(last_writer.values())
+
+    stop = threading.Event()
+
+    def _copy_batch(batch: List[int]) -> Dict[int, Exception]:
+        failures = {}
+        for i in batch:
+            if stop.is_set():
+                break
+            try:
+                if not (skip_unchanged and is_up_to_date(*jobs[i])):
+                    copy(*jobs[i])
+            except Exception as e:
+                failures[i] = e
+                if stop_on_error:
+                    stop.set()
+        return failures
+
+    batches = [
+        indices[i : i + COPY_BATCH_SIZE]
+        for i in range(0, len(indices), COPY_BATCH_SIZE)
+    ]
+
+    errors: Dict[int, Exception] = {}
+    with ThreadPoolExecutor(max_workers=min(COPY_WORKERS, len(batches))) as executor:
+        for failures in executor.map(_copy_batch, batches):
+            errors.update(failures)
+    return errors
+
+
+def find_matching_files(
+    pattern: str, dir_listings: Dict[str, List[str]]
+) -> List[str]:
+    """Return regular files matching a glob pattern
+
+    Patterns whose wildcards are confined to the final component (the only
+    kind copy_resources.yaml uses) are matched against a single os.scandir
+    listing of the parent directory. Listings are memoized in dir_listings,
+    so several operations globbing the same directory (*.png, *.ai, *.svg)
+    scan it once. Other patterns fall back to glob.glob.
+    """
+    directory, basename = os.path.split(pattern)
+    if glob.has_magic(directory):
+        return [f for f in glob.glob(pattern) if os.path.isfile(f)]
+
+    names = dir_listings.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = sorted(e.name for e in entries if e.is_file())
+        except FileNotFoundError:
+            names = []
+        dir_listings[directory] = names
+
+    # Like glob, hidden files only match patterns that start with a dot
+    include_hidden = basename.startswith(".")
+    match = _compile_name_pattern(basename)
+    return [
+        os.path.join(directory, name)
+        for name in names
+        if (include_hidden or not name.startswith(".")) and match(os.path.normcase(name))
+    ]
+
+
+@lru_cache(maxsize=None)
+def _compile_name_pattern(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """Compile a glob name pattern once; fnmatch.fnmatch re-normalizes per call"""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+def _load_copy_operations(config_path: Path) -> Optional[List[Dict]]:
+    """Load copy_operations from the config, reusing the parsed result while unchanged
+
+    Returns:
+        The copy_operations list, or None if the config doesn't define it
+    """
+    key = (str(config_path), config_path.stat().st_mtime_ns)
+    if key not in _config_cache:
+        with open(config_path, "rb") as f:
+            config = yaml.load(f, Loader=_YamlLoader) or {}
+        _config_cache.clear()
+        _config_cache[key] = config.get("copy_operations")
+    return _config_cache[key]
+
+
+def _run_git(
+    git: str,
+    args: List[str],
+    repo: Path,
+    env: Dict[str, str],
+    input: Optional[str] = None,
+) -> subprocess.CompletedProcess:
+    """Run git against repo without changing the child's working directory
+
+    An absolute git path, `git -C` instead of cwd= and close_fds=False are
+    the conditions under which CPython launches the child through
+    os.posix_spawn rather than its fork/exec path.
+    """
+    return subprocess.run(
+        [git, "-C", str(repo), *args],
+        input=input,
+        capture_output=True,
+        text=True,
+        env=env,
+        close_fds=False,
+    )
+
+
+def commit_resource_copies(
+    names: List[str], files: List[str], chromium_src: Path
 ) -> bool:
-    """Create a git commit for the copied resource"""
+    """Create a single git commit for all copied resources
+
+    Staging and committing once at the end avoids a git add/commit pair
+    (each of which rescans the Chromium index) per copy operation. Only the
+    copied files are staged: their paths are streamed to a single
+    `git update-index --stdin` process instead of letting `git add -A` walk
+    the entire Chromium worktree.
+    """
+    # Environment and git location resolved once and shared by both git calls
+    env = dict(os.environ)
+    git = shutil.which("git", path=env.get("PATH")) or "git"
+
     try:
-        # Stage all changes
-        cmd_add = ["git", "add", "-A"]
-        result = subprocess.run(
-            cmd_add, capture_output=True, text=True, cwd=chromium_src
+        # Stage exactly the copied files
+        paths = sorted({os.path.relpath(f, chromium_src) for f in files})
+        result = _run_git(
+            git,
+            ["update-index", "--add", "-z", "--stdin"],
+            chromium_src,
+            env,
+            input="\0".join(paths) + "\0",
         )
         if result.returncode != 0:
-            log_warning(f"Failed to stage changes for resource copy: {name}")
+            log_warning("Failed to stage changes for resource copies")
             if result.stderr:
                 log_warning(f"Error: {result.stderr}")
             return False
 
         # Create commit message
-        commit_message = f"resource: {name.lower()}"
+        if len(names) == 1:
+            commit_message = f"resource: {names[0].lower()}"
+        else:
+            details = "\n".join(f"- {name.lower()}" for name in names)
+            commit_message = f"resource: copy {len(names)} resources\n\n{details}"
 
         # Create the commit
-        cmd_commit = ["git", "commit", "-m", commit_message]
-        result = subprocess.run(
-            cmd_commit, capture_output=True, text=True, cwd=chromium_src
-        )
+        result = _run_git(git, ["commit", "-m", commit_message], chromium_src, env)
 
         if result.returncode == 0:
-            log_success(f"📝 Created commit for resource: {name}")
+            log_success(f"📝 Created commit for {len(names)} resource(s)")
             return True
         else:
-            log_warning(f"Failed to commit resource copy: {name}")
+            log_warning("Failed to commit resource copies")
             if result.stderr:
                 log_warning(f"Error: {result.stderr}")
             return False
 
     except Exception as e:
-        log_warning(f"Error creating commit for resource {name}: {e}")
+        log_warning(f"Error creating commit for resources: {e}")
         return False
@@ -2,8 +2,12 @@
 """String replacement module for BrowserOS build system"""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
+from ...common.module_cache import fingerprint_files
 from ...common.utils import log_info, log_success, log_error, log_warning
 
 
@@ -16,6 +20,12 @@ class StringReplacesModule(CommandModule):
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
 
+    def input_hash(self, ctx: Context) -> Optional[str]:
+        # Inputs are the rules below; the target files are what it rewrites
+        return fingerprint_files(
+            [], *target_files, *(f"{a}->{b}" for a, b in branding_replacements)
+        )
+
     def execute(self, ctx: Context) -> None:
         log_info("\n🔤 Applying string replacements...")
         if not apply_string_replacements_impl(ctx):
@@ -40,6 +50,39 @@ branding_replacements = [
     (r"Chrome", r"BrowserOS"),
 ]
 
+# All branding patterns fused into one alternation so each file is scanned
+# once. Alternatives are tried in list order at each position, which keeps
+# the longer phrases ahead of "Chromium"/"Chrome". Replacements must be plain
+# text (no backreferences), since group numbers shift inside the alternation.
+# Patterns are pure ASCII, so they run on raw UTF-8 bytes without decoding:
+# an ASCII byte never occurs inside a multi-byte UTF-8 sequence.
+_BRANDING_RE = re.compile(
+    b"|".join(
+        b"(?P<g%d>%s)" % (index, pattern.encode("ascii"))
+        for index, (pattern, _) in enumerate(branding_replacements)
+    )
+)
+_BRANDING_REPLACEMENTS = [
+    replacement.encode("ascii") for _, replacement in branding_replacements
+]
+
+
+def replace_branding(content: bytes) -> Tuple[bytes, List[int]]:
+    """Apply every branding replacement in one pass
+
+    Returns the new content and the number of matches per pattern, in
+    branding_replacements order.
+    """
+    counts = [0] * len(branding_replacements)
+
+    def _replace(match: re.Match) -> bytes:
+        index = int(match.lastgroup[1:])
+        counts[index] += 1
+        return _BRANDING_REPLACEMENTS[index]
+
+    return _BRANDING_RE.sub(_replace, content), counts
+
+
 # List of files to apply replacements to
 target_files = [
     "chrome/app/chromium_strings.grd",
@@ -47,47 +90,68 @@ target_files = [
 ]
 
 
+def _process_one(full_path: Path) -> Optional[List[int]]:
+    """Rewrite one file in place; returns per-pattern counts, or None if missing
+
+    Runs on a worker thread, so it only does I/O and matching; the caller
+    logs the results once all files are done.
+    """
+    if not full_path.exists():
+        return None
+
+    with open(full_path, "rb") as f:
+        original_content = f.read()
+
+    # Apply all replacements in a single scan
+    content, counts = replace_branding(original_content)
+
+    # Write back if changes were made
+    if content != original_content:
+        with open(full_path, "wb") as f:
+            f.write(content)
+    return counts
+
+
 def apply_string_replacements_impl(ctx: Context) -> bool:
-    """Internal implementation for applying string replacements"""
+    """Internal implementation for applying string replacements
+
+    Files are independent, so they are processed concurrently and the
+    results are logged afterwards in target_files order.
+    """
 
     success = True
 
-    for file_path in target_files:
-        full_path = ctx.chromium_src / file_path
+    with ThreadPoolExecutor(max_workers=min(8, len(target_files))) as executor:
+        futures = [
+            executor.submit(_process_one, ctx.chromium_src / file_path)
+            for file_path in target_files
+        ]
 
-        if not full_path.exists():
+    for file_path, future in zip(target_files, futures):
+        try:
+            counts = future.result()
+        except Exception as e:
+            log_info(f"  • Processing: {file_path}")
+            log_error(f"    Error processing {file_path}: {e}")
+            success = False
+            continue
+
+        if counts is None:
             log_warning(f"  ⚠️  File not found: {file_path}")
             continue
 
         log_info(f"  • Processing: {file_path}")
 
-        try:
-            # Read the file content
-            with open(full_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            original_content = content
-            replacement_count = 0
-
-            # Apply each replacement
-            for pattern, replacement in branding_replacements:
-                matches = len(re.findall(pattern, content))
-                if matches > 0:
-                    content = re.sub(pattern, replacement, content)
-                    replacement_count += matches
-                    log_info(f"    ✓ Replaced {matches} occurrences of '{pattern}'")
-
-            # Write back if changes were made
-            if content != original_content:
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                log_success(f"    Updated with {replacement_count} total replacements")
-            else:
-                log_info("    No replacements needed")
+        replacement_count = 0
+        for (pattern, _), matches in zip(branding_replacements, counts):
+            if matches > 0:
+                replacement_count += matches
+                log_info(f"    ✓ Replaced {matches} occurrences of '{pattern}'")
 
-        except Exception as e:
-            log_error(f"    Error processing {file_path}: {e}")
-            success = False
+        if replacement_count:
+            log_success(f"    Updated with {replacement_count} total replacements")
+        else:
+            log_info("    No replacements needed")
 
     if success:
         log_success("String replacements completed")
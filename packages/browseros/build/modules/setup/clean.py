@@ -3,6 +3,7 @@
 
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
+from ...common.module_cache import clear_all_stamps
 from ...common.utils import run_command, log_info, log_success, safe_rmtree
 
 
@@ -25,6 +26,8 @@ class CleanModule(CommandModule):
 
         log_info("\n🔀 Resetting git branch and removing tracked files...")
         self._git_reset(ctx)
+        # The reset undoes whatever cached modules applied to the tree
+        clear_all_stamps(ctx.root_dir)
 
         log_info("\n🧹 Cleaning Sparkle build artifacts...")
         self._clean_sparkle(ctx)
@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 """Application signing and notarization module for BrowserOS (macOS)"""
 
+import json
 import os
+import random
+import re
 import sys
+import time
 import subprocess
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Iterator, Optional, List, Dict, Tuple
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.env import EnvConfig
@@ -20,6 +27,18 @@ from ...common.utils import (
     join_paths,
 )
 
+# Concurrent codesign processes per signing phase. codesign is mostly waiting
+# on the timestamp server, so a handful of parallel calls overlaps that latency.
+SIGN_WORKERS = min(8, os.cpu_count() or 1)
+
+# Markers of transient notary service failures (network drops, Apple-side 5xx,
+# throttling) that are worth retrying rather than failing the build.
+NOTARYTOOL_RETRIABLE_MARKERS = (
+    "Could not reach",
+    "HTTP status code: 5",
+    "timed out",
+)
+
 # Central list of BrowserOS Server binaries we need to sign explicitly.
 # Each entry controls identifiers, signing options, and entitlement files so
 # adding a new binary is a one-line update here rather than scattered changes.
@@ -43,13 +62,28 @@ def get_browseros_server_binary_info(component_path: Path) -> Optional[Dict[str,
     return BROWSEROS_SERVER_BINARIES.get(name)
 
 
+# Lines of output kept from streamed commands; enough for notarytool's final
+# "id:"/"status:" summary and codesign's closing verdict
+STREAM_TAIL_LINES = 64
+
+
 def run_command(
     cmd: List[str],
     cwd: Optional[Path] = None,
     check: bool = True,
+    stream: bool = False,
 ) -> subprocess.CompletedProcess:
-    """Run a command and handle errors"""
-    return utils_run_command(cmd, cwd=cwd, check=check)
+    """Run a command and handle errors
+
+    With stream=True output is still shown live, but only the last
+    STREAM_TAIL_LINES lines are retained for parsing.
+    """
+    return utils_run_command(
+        cmd,
+        cwd=cwd,
+        check=check,
+        tail_lines=STREAM_TAIL_LINES if stream else None,
+    )
 
 
 class MacOSSignModule(CommandModule):
@@ -65,8 +99,7 @@ class MacOSSignModule(CommandModule):
         if not app_path.exists():
             raise ValidationError(f"App not found at: {app_path}")
 
-        env_ok, env_vars = check_environment(ctx.env)
-        if not env_ok:
+        if load_signing_env(ctx.env) is None:
             raise ValidationError("Required signing environment variables not set")
 
     def execute(self, ctx: Context) -> None:
@@ -75,7 +108,10 @@ class MacOSSignModule(CommandModule):
         log_info("=" * 70)
 
         app_path = ctx.get_app_path()
-        env_ok, env_vars = check_environment(ctx.env)
+        env_vars = load_signing_env(ctx.env)
+        if env_vars is None:
+            raise RuntimeError("Required signing environment variables not set")
+        unlock_signing_keychain(ctx.env)
 
         self._clear_extended_attributes(app_path)
         self._sign_all_components(app_path, env_vars["certificate_name"], ctx)
@@ -87,7 +123,11 @@ class MacOSSignModule(CommandModule):
 
     def _clear_extended_attributes(self, app_path: Path) -> None:
         log_info("🧹 Clearing extended attributes...")
-        run_command(["xattr", "-cs", str(app_path)])
+        remove_finder_detritus(app_path)
+        if app_has_xattrs(app_path):
+            run_command(["xattr", "-cs", str(app_path)])
+        else:
+            log_info("No extended attributes found, skipping xattr -cs")
 
     def _sign_all_components(self, app_path: Path, certificate_name: str, ctx: Context) -> None:
         if not sign_all_components(app_path, certificate_name, ctx.root_dir, ctx):
@@ -100,75 +140,194 @@ class MacOSSignModule(CommandModule):
     def _notarize(self, app_path: Path, env_vars: Dict[str, str], ctx: Context) -> None:
         if not notarize_app(app_path, ctx.root_dir, env_vars, ctx):
             raise RuntimeError("Notarization failed")
-def check_signing_environment(env: Optional[EnvConfig] = None) -> bool:
-    """Check if all required environment variables are set for signing (early check)
+_ENV_KEY_NAMES: Dict[str, str] = {
+    "certificate_name": "MACOS_CERTIFICATE_NAME",
+    "apple_id": "PROD_MACOS_NOTARIZATION_APPLE_ID",
+    "team_id": "PROD_MACOS_NOTARIZATION_TEAM_ID",
+    "notarization_pwd": "PROD_MACOS_NOTARIZATION_PWD",
+}
+
+
+def load_signing_env(env: Optional[EnvConfig] = None) -> Optional[Dict[str, str]]:
+    """Read the macOS signing/notarization settings once
 
     Args:
         env: Optional EnvConfig instance. If not provided, creates a new one.
-    """
-    # Only check on macOS
-    if not IS_MACOS:
-        return True
 
+    Returns:
+        Dict with certificate_name, apple_id, team_id and notarization_pwd,
+        or None (after logging every missing variable) if any is unset.
+    """
     if env is None:
         env = EnvConfig()
 
-    missing = []
-
-    if not env.macos_certificate_name:
-        missing.append("MACOS_CERTIFICATE_NAME")
-    if not env.macos_notarization_apple_id:
-        missing.append("PROD_MACOS_NOTARIZATION_APPLE_ID")
-    if not env.macos_notarization_team_id:
-        missing.append("PROD_MACOS_NOTARIZATION_TEAM_ID")
-    if not env.macos_notarization_password:
-        missing.append("PROD_MACOS_NOTARIZATION_PWD")
-
+    env_vars = env.get_macos_signing_config()
+    missing = [_ENV_KEY_NAMES[key] for key, value in env_vars.items() if not value]
     if missing:
         log_error("❌ Signing requires macOS environment variables!")
         log_error(f"Missing environment variables: {', '.join(missing)}")
         log_error("Please set all required environment variables before signing.")
-        return False
+        return None
 
-    return True
+    return env_vars
 
 
-def check_environment(env: Optional[EnvConfig] = None) -> Tuple[bool, Dict[str, str]]:
-    """Check if all required environment variables are set
+# Keep the keychain unlocked long enough for signing plus notarization
+KEYCHAIN_LOCK_TIMEOUT = 7200
 
-    Args:
-        env: Optional EnvConfig instance. If not provided, creates a new one.
+
+def get_signing_keychain(env: Optional[EnvConfig] = None) -> Optional[Path]:
+    """Return the keychain codesign should use, if one is configured
+
+    Passing it via --keychain lets codesign skip walking the search list.
+    Returns None when neither MACOS_KEYCHAIN_PATH nor MACOS_KEYCHAIN_PWD is
+    set, leaving codesign's default lookup untouched.
     """
     if env is None:
         env = EnvConfig()
 
-    env_vars = {
-        "certificate_name": env.macos_certificate_name or "",
-        "apple_id": env.macos_notarization_apple_id or "",
-        "team_id": env.macos_notarization_team_id or "",
-        "notarization_pwd": env.macos_notarization_password or "",
-    }
+    if env.macos_keychain_path:
+        return Path(env.macos_keychain_path).expanduser()
+    if env.macos_keychain_password:
+        return Path.home() / "Library" / "Keychains" / "login.keychain-db"
+    return None
 
-    missing = []
-    for key, value in env_vars.items():
-        if not value:
-            env_name = {
-                "certificate_name": "MACOS_CERTIFICATE_NAME",
-                "apple_id": "PROD_MACOS_NOTARIZATION_APPLE_ID",
-                "team_id": "PROD_MACOS_NOTARIZATION_TEAM_ID",
-                "notarization_pwd": "PROD_MACOS_NOTARIZATION_PWD",
-            }[key]
-            missing.append(env_name)
 
-    if missing:
-        log_error(f"Required environment variables not set: {', '.join(missing)}")
-        return False, env_vars
+def unlock_signing_keychain(env: Optional[EnvConfig] = None) -> Optional[Path]:
+    """Unlock the signing keychain once so codesign calls don't re-prompt
+
+    Also extends the auto-lock timeout so the keychain stays unlocked for the
+    whole pipeline. Returns the keychain to pass to codesign, or None.
+    """
+    if env is None:
+        env = EnvConfig()
+
+    keychain = get_signing_keychain(env)
+    if keychain is None or not env.macos_keychain_password:
+        return keychain
+
+    log_info(f"🔑 Unlocking signing keychain: {keychain}")
+    # Not run_command: it logs the full command line, which holds the password
+    result = subprocess.run(
+        [
+            "security",
+            "unlock-keychain",
+            "-p",
+            env.macos_keychain_password,
+            str(keychain),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        log_warning(f"Failed to unlock keychain: {result.stderr.strip()}")
+        return keychain
+
+    run_command(
+        [
+            "security",
+            "set-keychain-settings",
+            "-lut",
+            str(KEYCHAIN_LOCK_TIMEOUT),
+            str(keychain),
+        ],
+        check=False,
+    )
+    return keychain
+
+
+def iter_bundle_tree(root: Path) -> Iterator[os.DirEntry]:
+    """Yield every entry below root in one depth-first os.scandir walk
+
+    Like Path.rglob, symlinks are yielded but symlinked directories are not
+    descended into, so framework Versions/Current links aren't walked twice.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+
+
+FINDER_DETRITUS = {".DS_Store", "__MACOSX"}
+
+
+def remove_finder_detritus(app_path: Path) -> None:
+    """Delete .DS_Store files and __MACOSX folders before they get sealed
+
+    Must run before signing: removing sealed files afterwards would invalidate
+    the signature, and leaving them in bloats the notarization archive.
+    """
+    for entry in list(iter_bundle_tree(app_path)):
+        if entry.name not in FINDER_DETRITUS:
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            Path(entry.path).unlink(missing_ok=True)
 
-    return True, env_vars
+
+def app_has_xattrs(app_path: Path) -> bool:
+    """Return True if any file in the bundle carries an extended attribute
+
+    Stops listing as soon as xattr prints its first byte, so clean ninja
+    output (the common case) costs one read-only walk instead of a full
+    recursive clear. Errs on the side of clearing if the probe fails.
+    """
+    try:
+        process = subprocess.Popen(
+            ["xattr", "-rl", str(app_path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return True
+
+    try:
+        return bool(process.stdout.read(1))
+    finally:
+        process.kill()
+        process.wait()
+        process.stdout.close()
+
+
+# Discovered components keyed by (app path, framework version, Frameworks mtime)
+_components_cache: Dict[Tuple[str, str, int], Dict[str, List[Path]]] = {}
 
 
 def find_components_to_sign(
     app_path: Path, ctx: Optional[Context] = None
+) -> Dict[str, List[Path]]:
+    """Find all components that need signing, reusing an earlier discovery
+
+    Signing doesn't add or remove bundles, so repeated passes over the same
+    app (for example re-signing after a failed notarization) reuse the first
+    walk. The Frameworks directory mtime is part of the key so a rebuilt app
+    is rediscovered.
+    """
+    framework_path = join_paths(app_path, "Contents", "Frameworks")
+    try:
+        framework_mtime = framework_path.stat().st_mtime_ns
+    except OSError:
+        framework_mtime = 0
+    version = ctx.browseros_chromium_version if ctx else ""
+    key = (str(app_path), version, framework_mtime)
+
+    if key not in _components_cache:
+        _components_cache[key] = _discover_components(app_path, ctx)
+    return {
+        category: list(items) for category, items in _components_cache[key].items()
+    }
+
+
+def _discover_components(
+    app_path: Path, ctx: Optional[Context] = None
 ) -> Dict[str, List[Path]]:
     """Dynamically find all components that need signing"""
     components = {
@@ -217,12 +376,28 @@ def find_components_to_sign(
                     components["executables"].append(item)
             break  # Use the first valid path found
 
+    # Collect XPC services, frameworks, dylibs and apps in a single walk
+    # instead of one recursive glob per extension
+    by_suffix: Dict[str, List[Path]] = {
+        ".xpc": [],
+        ".framework": [],
+        ".dylib": [],
+        ".app": [],
+    }
+    for entry in iter_bundle_tree(framework_path):
+        # Symlinked aliases (Versions/Current style) point at bundles that are
+        # already reached through their real path
+        if entry.is_symlink():
+            continue
+        matches = by_suffix.get(os.path.splitext(entry.name)[1])
+        if matches is not None:
+            matches.append(Path(entry.path))
+
     # Find all XPC services
-    for xpc_path in framework_path.rglob("*.xpc"):
-        components["xpc_services"].append(xpc_path)
+    components["xpc_services"].extend(by_suffix[".xpc"])
 
     # Find all frameworks (with special handling for Sparkle)
-    for fw_path in framework_path.rglob("*.framework"):
+    for fw_path in by_suffix[".framework"]:
         components["frameworks"].append(fw_path)
 
         # Special handling for Sparkle framework versioned structure
@@ -242,47 +417,71 @@ def find_components_to_sign(
             components["dylibs"].extend(libraries_dir.glob("*.dylib"))
 
     # Also find dylibs in other frameworks
-    for dylib_path in framework_path.rglob("*.dylib"):
-        if dylib_path not in components["dylibs"]:
-            components["dylibs"].append(dylib_path)
+    components["dylibs"].extend(by_suffix[".dylib"])
 
     # Find all nested apps (like Updater.app in Sparkle)
-    for nested_app in framework_path.rglob("*.app"):
-        if nested_app not in components["helpers"]:
+    helpers = {os.path.realpath(helper) for helper in components["helpers"]}
+    for nested_app in by_suffix[".app"]:
+        if os.path.realpath(nested_app) not in helpers:
             components["apps"].append(nested_app)
 
     # Find BrowserOS Server binaries
     browseros_server_dir = join_paths(app_path, "Contents", "Resources", "BrowserOSServer")
-    if browseros_server_dir.exists():
-        for item in browseros_server_dir.rglob("*"):
-            if item.is_file() and not item.suffix and os.access(item, os.X_OK):
-                components["executables"].append(item)
+    for entry in iter_bundle_tree(browseros_server_dir):
+        if (
+            entry.is_file()
+            and not os.path.splitext(entry.name)[1]
+            and os.access(entry.path, os.X_OK)
+        ):
+            components["executables"].append(Path(entry.path))
+
+    # Each bundle must be signed exactly once, whichever path reached it
+    return {
+        category: _dedupe_by_real_path(items) for category, items in components.items()
+    }
+
 
-    return components
+def _dedupe_by_real_path(paths: List[Path]) -> List[Path]:
+    """Drop paths resolving to an already-seen file, keeping first-seen order"""
+    unique: Dict[str, Path] = {}
+    for path in paths:
+        unique.setdefault(os.path.realpath(path), path)
+    return list(unique.values())
+
+
+# Known components whose identifier is fixed, matched as a substring of the
+# path. Listed in priority order: the first entry present anywhere in the path
+# wins, e.g. Sparkle.framework/.../Updater.app is the Updater, not Sparkle.
+_SPECIAL_IDENTIFIERS: Dict[str, str] = {
+    "Downloader": "org.sparkle-project.Downloader",
+    "Installer": "org.sparkle-project.Installer",
+    "Updater": "org.sparkle-project.Updater",
+    "Autoupdate": "org.sparkle-project.Autoupdate",
+    "Sparkle": "org.sparkle-project.Sparkle",
+    "chrome_crashpad_handler": "{base}.crashpad_handler",
+    "app_mode_loader": "{base}.app_mode_loader",
+    "web_app_shortcut_copier": "{base}.web_app_shortcut_copier",
+}
+_SPECIAL_PRIORITY = {key: index for index, key in enumerate(_SPECIAL_IDENTIFIERS)}
+_SPECIAL_RE = re.compile("|".join(map(re.escape, _SPECIAL_IDENTIFIERS)))
+_HELPER_TYPE_RE = re.compile(r"\(([^)]+)\)")
 
 
+@lru_cache(maxsize=4096)
 def get_identifier_for_component(
     component_path: Path, base_identifier: str = "com.browseros"
 ) -> str:
     """Generate identifier for a component based on its path and name"""
     name = component_path.stem
 
-    # Special cases for known components
-    special_identifiers = {
-        "Downloader": "org.sparkle-project.Downloader",
-        "Installer": "org.sparkle-project.Installer",
-        "Updater": "org.sparkle-project.Updater",
-        "Autoupdate": "org.sparkle-project.Autoupdate",
-        "Sparkle": "org.sparkle-project.Sparkle",
-        "chrome_crashpad_handler": f"{base_identifier}.crashpad_handler",
-        "app_mode_loader": f"{base_identifier}.app_mode_loader",
-        "web_app_shortcut_copier": f"{base_identifier}.web_app_shortcut_copier",
-    }
-
     # Check for special cases
-    for key, identifier in special_identifiers.items():
-        if key in str(component_path):
-            return identifier
+    special = min(
+        (match.group(0) for match in _SPECIAL_RE.finditer(str(component_path))),
+        key=_SPECIAL_PRIORITY.__getitem__,
+        default=None,
+    )
+    if special:
+        return _SPECIAL_IDENTIFIERS[special].format(base=base_identifier)
 
     # BrowserOS Server binaries share the same entitlements/options but need unique identifiers.
     browseros_server_info = get_browseros_server_binary_info(component_path)
@@ -293,9 +492,9 @@ def get_identifier_for_component(
     # For helper apps
     if "Helper" in name:
         # Extract the helper type (GPU, Renderer, Plugin, Alerts)
-        if "(" in name and ")" in name:
-            helper_type = name[name.find("(") + 1 : name.find(")")].lower()
-            return f"{base_identifier}.helper.{helper_type}"
+        helper_type = _HELPER_TYPE_RE.search(name)
+        if helper_type:
+            return f"{base_identifier}.helper.{helper_type.group(1).lower()}"
         else:
             return f"{base_identifier}.helper"
 
@@ -349,12 +548,133 @@ def sign_component(
     identifier: Optional[str] = None,
     options: Optional[str] = None,
     entitlements: Optional[Path] = None,
+    keychain: Optional[Path] = None,
 ) -> bool:
     """Sign a single component"""
+    return sign_components(
+        [component_path],
+        certificate_name,
+        identifier,
+        options,
+        entitlements,
+        keychain=keychain,
+    )
+
+
+# Sidecar record of leaf binaries signed by earlier runs, mapping
+# "path|certificate|identifier|options|entitlements|prefix" (plus the
+# entitlements file's [mtime_ns, size]) to the [mtime_ns, size] codesign
+# left them with. Signing rewrites the file, so any later change (a
+# rebuild, another signature) moves the mtime too. Only active between
+# load/save_sign_cache calls.
+_sign_cache: Dict[str, List] = {}
+_sign_cache_file: Optional[Path] = None
+
+
+def load_sign_cache(root_dir: Path) -> None:
+    """Load the signed-leaf cache from root_dir/.build_cache/codesign.json"""
+    global _sign_cache, _sign_cache_file
+    _sign_cache_file = join_paths(root_dir, ".build_cache", "codesign.json")
+    try:
+        _sign_cache = json.loads(_sign_cache_file.read_text())
+    except (OSError, ValueError):
+        _sign_cache = {}
+
+
+def save_sign_cache() -> None:
+    """Persist the signed-leaf cache; failures only cost a re-sign next run"""
+    if _sign_cache_file is None:
+        return
+    try:
+        _sign_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _sign_cache_file.write_text(json.dumps(_sign_cache, indent=2))
+    except OSError as e:
+        log_warning(f"Could not save codesign cache: {e}")
+
+
+def close_sign_cache() -> None:
+    """Stop consulting the cache; later signing calls always run codesign"""
+    global _sign_cache, _sign_cache_file
+    _sign_cache = {}
+    _sign_cache_file = None
+
+
+def _leaf_stat(path: Path) -> Optional[List[int]]:
+    """[mtime_ns, size] for a regular file, None for bundles and missing paths"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _is_already_signed(path: Path, key: str) -> bool:
+    """True if path is unchanged since we signed it with the same arguments
+
+    Only regular files are cached: a bundle's own stat doesn't change when
+    its contents do, so bundles are always re-signed. Costs one stat, no
+    codesign process, so cached batches stay a single codesign call.
+    """
+    entry = _sign_cache.get(key)
+    if not entry:
+        return False
+    current = _leaf_stat(path)
+    return current is not None and current == entry[:2]
+
+
+def _record_signed(path: Path, key: str) -> None:
+    current = _leaf_stat(path)
+    if current is not None:
+        _sign_cache[key] = current
+
+
+def sign_components(
+    component_paths: List[Path],
+    certificate_name: str,
+    identifier: Optional[str] = None,
+    options: Optional[str] = None,
+    entitlements: Optional[Path] = None,
+    prefix: Optional[str] = None,
+    keychain: Optional[Path] = None,
+) -> bool:
+    """Sign several components that share the same signing arguments
+
+    codesign accepts multiple paths per invocation, so components with an
+    identical identifier/options/entitlements triple are signed by a single
+    process instead of one process (and one keychain lookup) each. With
+    prefix (and no identifier) each file gets its implicit identifier
+    prefixed, which lets files needing distinct identifiers share a call.
+
+    While a sign cache is loaded, leaf files already signed with the same
+    arguments and unchanged since are skipped.
+    """
+    keys: Dict[Path, str] = {}
+    if _sign_cache_file is not None:
+        args = "|".join(
+            str(arg or "")
+            for arg in (certificate_name, identifier, options, entitlements, prefix)
+        )
+        if entitlements:
+            # Edited entitlements must re-sign binaries that didn't change
+            args += f"|{_leaf_stat(entitlements)}"
+        keys = {path: f"{path}|{args}" for path in component_paths}
+        component_paths = [
+            path for path in component_paths if not _is_already_signed(path, keys[path])
+        ]
+        if not component_paths:
+            return True
+
     cmd = ["codesign", "--sign", certificate_name, "--force", "--timestamp"]
 
+    if keychain:
+        cmd.extend(["--keychain", str(keychain)])
+
     if identifier:
         cmd.extend(["--identifier", identifier])
+    elif prefix:
+        cmd.extend(["--prefix", prefix])
 
     if options:
         cmd.extend(["--options", options])
@@ -362,15 +682,84 @@ def sign_component(
     if entitlements and entitlements.exists():
         cmd.extend(["--entitlements", str(entitlements)])
 
-    cmd.append(str(component_path))
+    cmd.extend(str(path) for path in component_paths)
 
     try:
         run_command(cmd)
-        return True
     except Exception as e:
-        log_error(f"Failed to sign {component_path}: {e}")
+        targets = ", ".join(str(path) for path in component_paths)
+        log_error(f"Failed to sign {targets}: {e}")
         return False
 
+    for path in component_paths:
+        if path in keys:
+            _record_signed(path, keys[path])
+    return True
+
+
+# (component, identifier, options, entitlements) for one component to sign
+SignSpec = Tuple[Path, Optional[str], Optional[str], Optional[Path]]
+
+
+def sign_component_group(
+    specs: List[SignSpec],
+    certificate_name: str,
+    keychain: Optional[Path] = None,
+) -> bool:
+    """Sign components of one signing phase, batching identical arguments
+
+    Components that share identifier, options and entitlements are signed in
+    one codesign call, and the resulting calls run concurrently. Phases are
+    still signed one after another, so bottom-up ordering is unchanged.
+    """
+    groups: Dict[Tuple[Optional[str], Optional[str], Optional[Path]], List[Path]] = {}
+    for path, identifier, options, entitlements in specs:
+        groups.setdefault((identifier, options, entitlements), []).append(path)
+
+    if not groups:
+        return True
+
+    def _sign(item) -> bool:
+        (identifier, options, entitlements), paths = item
+        return sign_components(
+            paths, certificate_name, identifier, options, entitlements, keychain=keychain
+        )
+
+    # Codesign runs in child processes, so threads are enough to overlap them
+    with ThreadPoolExecutor(max_workers=min(SIGN_WORKERS, len(groups))) as executor:
+        results = list(executor.map(_sign, groups.items()))
+    return all(results)
+
+
+@lru_cache(maxsize=None)
+def find_entitlements(
+    entitlements_name: Optional[str], entitlements_dirs: Tuple[Path, ...]
+) -> Optional[Path]:
+    """Return the first existing entitlements file with the given name
+
+    Memoized: every helper and BrowserOS Server binary resolves one of a
+    handful of names against the same directories, and the signing passes
+    for each architecture repeat those lookups.
+    """
+    if not entitlements_name:
+        return None
+    for ent_dir in entitlements_dirs:
+        ent_path = join_paths(ent_dir, entitlements_name)
+        if ent_path.exists():
+            return ent_path
+    return None
+
+
+def get_helper_entitlements_name(helper: Path) -> Optional[str]:
+    """Return the entitlements file name for a Chromium helper app"""
+    if "Renderer" in helper.name:
+        return "helper-renderer-entitlements.plist"
+    elif "GPU" in helper.name:
+        return "helper-gpu-entitlements.plist"
+    elif "Plugin" in helper.name:
+        return "helper-plugin-entitlements.plist"
+    return None
+
 
 def sign_all_components(
     app_path: Path,
@@ -378,7 +767,25 @@ def sign_all_components(
     root_dir: Path,
     ctx: Optional[Context] = None,
 ) -> bool:
-    """Sign all components in the correct order (bottom-up)"""
+    """Sign all components in the correct order (bottom-up)
+
+    Leaf binaries left unchanged since a previous run are skipped using the
+    sidecar cache in root_dir/.build_cache.
+    """
+    load_sign_cache(root_dir)
+    try:
+        return _sign_all_phases(app_path, certificate_name, root_dir, ctx)
+    finally:
+        save_sign_cache()
+        close_sign_cache()
+
+
+def _sign_all_phases(
+    app_path: Path,
+    certificate_name: str,
+    root_dir: Path,
+    ctx: Optional[Context] = None,
+) -> bool:
     log_info("🔍 Discovering components to sign...")
     components = find_components_to_sign(app_path, ctx)
 
@@ -389,104 +796,106 @@ def sign_all_components(
         if items:
             log_info(f"  • {category}: {len(items)} items")
 
+    # Get entitlements directory from context, resolved once for all phases
+    entitlements_dirs = (ctx.get_entitlements_dir(),) if ctx else ()
+    keychain = get_signing_keychain(ctx.env if ctx else None)
+
     # Sign in correct order (bottom-up)
     # 1. Sign XPC Services first
     log_info("\n🔏 Signing XPC Services...")
-    for xpc in components["xpc_services"]:
-        identifier = get_identifier_for_component(xpc)
-        options = get_signing_options(xpc)
-        if not sign_component(xpc, certificate_name, identifier, options):
-            return False
+    specs = [
+        (xpc, get_identifier_for_component(xpc), get_signing_options(xpc), None)
+        for xpc in components["xpc_services"]
+    ]
+    if not sign_component_group(specs, certificate_name, keychain):
+        return False
 
     # 2. Sign nested apps (like Sparkle's Updater.app)
     if components["apps"]:
         log_info("\n🔏 Signing nested applications...")
-        for nested_app in components["apps"]:
-            identifier = get_identifier_for_component(nested_app)
-            options = get_signing_options(nested_app)
-            if not sign_component(nested_app, certificate_name, identifier, options):
-                return False
+        specs = [
+            (app, get_identifier_for_component(app), get_signing_options(app), None)
+            for app in components["apps"]
+        ]
+        if not sign_component_group(specs, certificate_name, keychain):
+            return False
 
     # 3. Sign executables
     if components["executables"]:
         log_info("\n🔏 Signing executables...")
-        # Get entitlements directory from context
-        entitlements_dirs = []
-        if ctx:
-            entitlements_dirs.append(ctx.get_entitlements_dir())
-
+        specs = []
         for exe in components["executables"]:
-            identifier = get_identifier_for_component(exe)
-            options = get_signing_options(exe)
-
             # Check for specific entitlements
-            entitlements = None
             browseros_server_info = get_browseros_server_binary_info(exe)
-            if browseros_server_info:
-                entitlements_name = browseros_server_info.get("entitlements")
-                if entitlements_name:
-                    for ent_dir in entitlements_dirs:
-                        ent_path = join_paths(ent_dir, entitlements_name)
-                        if ent_path.exists():
-                            entitlements = ent_path
-                            break
-
-            if not sign_component(exe, certificate_name, identifier, options, entitlements):
-                return False
+            entitlements = find_entitlements(
+                browseros_server_info.get("entitlements")
+                if browseros_server_info
+                else None,
+                entitlements_dirs,
+            )
+            specs.append(
+                (
+                    exe,
+                    get_identifier_for_component(exe),
+                    get_signing_options(exe),
+                    entitlements,
+                )
+            )
+        if not sign_component_group(specs, certificate_name, keychain):
+            return False
 
     # 4. Sign dylibs
     if components["dylibs"]:
         log_info("\n🔏 Signing dynamic libraries...")
+        # codesign's implicit identifier for a dylib is its file name without
+        # extension; with --prefix that equals get_identifier_for_component's
+        # "com.browseros.<stem>" whenever the stem has no dots, so all such
+        # leaf dylibs are signed in one call without per-file --identifier
+        prefix = "com.browseros."
+        prefixed = []
+        specs = []
         for dylib in components["dylibs"]:
             identifier = get_identifier_for_component(dylib)
-            if not sign_component(dylib, certificate_name, identifier):
-                return False
+            if "." not in dylib.stem and identifier == prefix + dylib.stem:
+                prefixed.append(dylib)
+            else:
+                specs.append((dylib, identifier, None, None))
+        if prefixed and not sign_components(
+            prefixed, certificate_name, prefix=prefix, keychain=keychain
+        ):
+            return False
+        if not sign_component_group(specs, certificate_name, keychain):
+            return False
 
     # 5. Sign helper apps
     if components["helpers"]:
         log_info("\n🔏 Signing helper applications...")
-        # Get entitlements directory from context
-        entitlements_dirs = []
-        if ctx:
-            entitlements_dirs.append(ctx.get_entitlements_dir())
-
-        for helper in components["helpers"]:
-            identifier = get_identifier_for_component(helper)
-            options = get_signing_options(helper)
-
-            # Check for specific entitlements
-            entitlements = None
-            entitlements_name = None
-
-            if "Renderer" in helper.name:
-                entitlements_name = "helper-renderer-entitlements.plist"
-            elif "GPU" in helper.name:
-                entitlements_name = "helper-gpu-entitlements.plist"
-            elif "Plugin" in helper.name:
-                entitlements_name = "helper-plugin-entitlements.plist"
-
-            if entitlements_name:
-                for ent_dir in entitlements_dirs:
-                    ent_path = join_paths(ent_dir, entitlements_name)
-                    if ent_path.exists():
-                        entitlements = ent_path
-                        break
-
-            if not sign_component(
-                helper, certificate_name, identifier, options, entitlements
-            ):
-                return False
+        specs = [
+            (
+                helper,
+                get_identifier_for_component(helper),
+                get_signing_options(helper),
+                find_entitlements(
+                    get_helper_entitlements_name(helper), entitlements_dirs
+                ),
+            )
+            for helper in components["helpers"]
+        ]
+        if not sign_component_group(specs, certificate_name, keychain):
+            return False
 
     # 6. Sign frameworks (except the main BrowserOS Framework)
     if components["frameworks"]:
         log_info("\n🔏 Signing frameworks...")
-        # Sort to sign Sparkle.framework before BrowserOS Framework.framework
-        frameworks_sorted = sorted(
-            components["frameworks"], key=lambda x: 0 if "Sparkle" in x.name else 1
-        )
-        for framework in frameworks_sorted:
-            identifier = get_identifier_for_component(framework)
-            if not sign_component(framework, certificate_name, identifier):
+        # Sign Sparkle.framework before BrowserOS Framework.framework, which
+        # embeds it; the two sets are signed as separate phases
+        for is_sparkle in (True, False):
+            specs = [
+                (framework, get_identifier_for_component(framework), None, None)
+                for framework in components["frameworks"]
+                if ("Sparkle" in framework.name) == is_sparkle
+            ]
+            if not sign_component_group(specs, certificate_name, keychain):
                 return False
 
     # 7. Sign main executable
@@ -506,7 +915,9 @@ def sign_all_components(
         )
         return False
 
-    if not sign_component(main_exe, certificate_name, "com.browseros.BrowserOS"):
+    if not sign_component(
+        main_exe, certificate_name, "com.browseros.BrowserOS", keychain=keychain
+    ):
         return False
 
     # 8. Finally sign the app bundle
@@ -520,30 +931,19 @@ def sign_all_components(
     # Try multiple locations for app entitlements
     entitlements = None
     entitlements_names = ["app-entitlements.plist", "app-entitlements-chrome.plist"]
-    entitlements_dirs = []
-    if ctx:
-        entitlements_dirs.append(ctx.get_entitlements_dir())
-    else:
-        entitlements_dirs.append(join_paths(root_dir, "resources", "entitlements"))
-    # Add fallback locations
-    entitlements_dirs.extend(
-        [
-            join_paths(root_dir, "entitlements"),  # Legacy location
-            join_paths(root_dir, "build", "src", "chrome", "app"),
-            join_paths(
-                app_path.parent.parent.parent, "chrome", "app"
-            ),  # Chromium source
-        ]
+    app_entitlements_dirs = (
+        entitlements_dirs or (join_paths(root_dir, "resources", "entitlements"),)
+    ) + (
+        # Fallback locations
+        join_paths(root_dir, "entitlements"),  # Legacy location
+        join_paths(root_dir, "build", "src", "chrome", "app"),
+        join_paths(app_path.parent.parent.parent, "chrome", "app"),  # Chromium source
     )
 
     for ent_name in entitlements_names:
-        for ent_dir in entitlements_dirs:
-            ent_path = join_paths(ent_dir, ent_name)
-            if ent_path.exists():
-                entitlements = ent_path
-                log_info(f"  Using entitlements: {entitlements}")
-                break
+        entitlements = find_entitlements(ent_name, app_entitlements_dirs)
         if entitlements:
+            log_info(f"  Using entitlements: {entitlements}")
             break
 
     cmd = [
@@ -560,6 +960,9 @@ def sign_all_components(
         requirements,
     ]
 
+    if keychain:
+        cmd.extend(["--keychain", str(keychain)])
+
     if entitlements:
         cmd.extend(["--entitlements", str(entitlements)])
     else:
@@ -582,6 +985,7 @@ def verify_signature(app_path: Path) -> bool:
     result = run_command(
         ["codesign", "--verify", "--deep", "--strict", "--verbose=2", str(app_path)],
         check=False,
+        stream=True,
     )
 
     if result.returncode != 0:
@@ -592,6 +996,40 @@ def verify_signature(app_path: Path) -> bool:
     return True
 
 
+def _is_retriable_notarytool_failure(result: subprocess.CompletedProcess) -> bool:
+    """Return True if a failed notarytool/stapler call looks transient"""
+    output = (result.stdout or "") + (result.stderr or "")
+    if "status: Invalid" in output:
+        return False
+    if any(marker in output for marker in NOTARYTOOL_RETRIABLE_MARKERS):
+        return True
+    return not (result.stdout or "").strip()
+
+
+def retry_notarytool(
+    cmd: List[str],
+    max_attempts: int = 5,
+    base: float = 30.0,
+    cap: float = 600.0,
+) -> subprocess.CompletedProcess:
+    """Run a notarization command, retrying transient failures with jittered backoff"""
+    for attempt in range(max_attempts):
+        # submit --wait prints a progress line per poll; keep only the tail
+        result = run_command(cmd, check=False, stream=True)
+        if result.returncode == 0 or attempt == max_attempts - 1:
+            return result
+        if not _is_retriable_notarytool_failure(result):
+            return result
+
+        delay = min(cap, base * 2**attempt) * random.uniform(0.5, 1.5)
+        log_warning(
+            f"Transient failure from {cmd[1]} (attempt {attempt + 1}/{max_attempts}), "
+            f"retrying in {delay:.0f}s..."
+        )
+        time.sleep(delay)
+    return result
+
+
 def notarize_app(
     app_path: Path,
     root_dir: Path,
@@ -608,9 +1046,29 @@ def notarize_app(
     if notarize_zip.exists():
         notarize_zip.unlink()
 
-    run_command(["ditto", "-c", "-k", "--keepParent", str(app_path), str(notarize_zip)])
+    run_command(
+        [
+            "ditto",
+            "-c",
+            "-k",
+            "--sequesterRsrc",
+            "--keepParent",
+            str(app_path),
+            str(notarize_zip),
+        ]
+    )
     log_success("Archive created for notarization")
 
+    try:
+        return _submit_and_staple(app_path, notarize_zip, env_vars)
+    finally:
+        notarize_zip.unlink(missing_ok=True)
+
+
+def _submit_and_staple(
+    app_path: Path, notarize_zip: Path, env_vars: Dict[str, str]
+) -> bool:
+    """Submit the notarization archive, then staple and verify the app"""
     # Store credentials
     log_info("🔑 Storing notarization credentials...")
     run_command(
@@ -631,7 +1089,7 @@ def notarize_app(
 
     # Submit for notarization
     log_info("📤 Submitting application for notarization (this may take a while)...")
-    result = run_command(
+    result = retry_notarytool(
         [
             "xcrun",
             "notarytool",
@@ -640,8 +1098,7 @@ def notarize_app(
             "--keychain-profile",
             "notarytool-profile",
             "--wait",
-        ],
-        check=False,
+        ]
     )
 
     log_info(result.stdout)
@@ -669,7 +1126,7 @@ def notarize_app(
 
     # Staple the ticket
     log_info("📎 Stapling notarization ticket to application...")
-    result = run_command(["xcrun", "stapler", "staple", str(app_path)], check=False)
+    result = retry_notarytool(["xcrun", "stapler", "staple", str(app_path)])
 
     if result.returncode != 0:
         log_error("Failed to staple notarization ticket!")
@@ -677,9 +1134,6 @@ def notarize_app(
 
     log_success("Notarization ticket stapled successfully")
 
-    # Clean up
-    notarize_zip.unlink()
-
     # Verify notarization
     log_info("\n🔍 Verifying notarization status...")
 
@@ -701,8 +1155,16 @@ def notarize_app(
     return True
 
 
-def sign_app(ctx: Context, create_dmg: bool = True) -> bool:
-    """Main signing function that uses BuildContext from build.py"""
+def sign_app(
+    ctx: Context,
+    create_dmg: bool = True,
+    env_vars: Optional[Dict[str, str]] = None,
+) -> bool:
+    """Main signing function that uses BuildContext from build.py
+
+    Callers that already loaded the signing environment (e.g. sign_universal)
+    can pass env_vars to avoid reading and validating it again.
+    """
     log_info("=" * 70)
     log_info("🚀 Starting signing process for BrowserOS...")
     log_info("=" * 70)
@@ -718,9 +1180,11 @@ def sign_app(ctx: Context, create_dmg: bool = True) -> bool:
         log_error(msg)
 
     # Check environment
-    env_ok, env_vars = check_environment()
-    if not env_ok:
+    if env_vars is None:
+        env_vars = load_signing_env(ctx.env)
+    if env_vars is None:
         return False
+    unlock_signing_keychain(ctx.env)
 
     # Setup app path
     app_path = ctx.get_app_path()
@@ -740,7 +1204,11 @@ def sign_app(ctx: Context, create_dmg: bool = True) -> bool:
     try:
         # Clear extended attributes
         log_info("🧹 Clearing extended attributes...")
-        run_command(["xattr", "-cs", str(app_path)])
+        remove_finder_detritus(app_path)
+        if app_has_xattrs(app_path):
+            run_command(["xattr", "-cs", str(app_path)])
+        else:
+            log_info("No extended attributes found, skipping xattr -cs")
 
         # Sign all components
         if not sign_all_components(
@@ -815,6 +1283,10 @@ def sign_universal(contexts: List[Context]) -> bool:
         log_error("Universal build requires at least 2 architectures")
         return False
 
+    env_vars = load_signing_env(contexts[0].env)
+    if env_vars is None:
+        return False
+
     # Verify all app builds exist
     app_paths = []
     for ctx in contexts:
@@ -869,7 +1341,7 @@ def sign_universal(contexts: List[Context]) -> bool:
         universal_ctx.out_dir = "out/Default_universal"
 
         # Sign the universal binary
-        if not sign_app(universal_ctx, create_dmg=False):
+        if not sign_app(universal_ctx, create_dmg=False, env_vars=env_vars):
             log_error("Failed to sign universal binary")
             return False
 
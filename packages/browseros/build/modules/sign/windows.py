@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 """Windows signing module for BrowserOS"""
 
+import json
+import os
+import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.env import EnvConfig
@@ -12,15 +17,21 @@ from ...common.utils import (
     log_error,
     log_success,
     log_warning,
-    join_paths,
     IS_WINDOWS,
 )
+from ..package.windows import WindowsBuildPaths
 
 BROWSEROS_SERVER_BINARIES: List[str] = [
     "browseros_server.exe",
     "codex.exe",
 ]
 
+# Concurrent CodeSignTool runs; each is mostly eSigner round trips, and
+# two stays inside the service's rate limits
+SIGN_WORKERS = 2
+# Delay between sign launches so their TOTP logins don't coincide
+SIGN_STAGGER_SECONDS = 0.5
+
 
 class WindowsSignModule(CommandModule):
     produces = ["signed_installer"]
@@ -31,7 +42,7 @@ class WindowsSignModule(CommandModule):
         if not IS_WINDOWS():
             raise ValidationError("Windows signing requires Windows")
 
-        build_output_dir = join_paths(ctx.chromium_src, ctx.out_dir)
+        build_output_dir = WindowsBuildPaths.from_ctx(ctx).build_dir
         if not build_output_dir.exists():
             raise ValidationError(f"Build output directory not found: {build_output_dir}")
 
@@ -53,11 +64,11 @@ class WindowsSignModule(CommandModule):
     def execute(self, ctx: Context) -> None:
         log_info("\n🔏 Signing Windows binaries...")
 
-        build_output_dir = join_paths(ctx.chromium_src, ctx.out_dir)
+        paths = WindowsBuildPaths.from_ctx(ctx)
 
-        self._sign_executables(build_output_dir, ctx.env)
+        self._sign_executables(paths.build_dir, ctx.env)
         self._build_mini_installer(ctx)
-        mini_installer_path = self._sign_installer(build_output_dir, ctx.env)
+        mini_installer_path = self._sign_installer(paths.mini_installer, ctx.env)
 
         ctx.artifact_registry.add("signed_installer", mini_installer_path)
         log_success("✅ All binaries signed successfully!")
@@ -86,9 +97,8 @@ class WindowsSignModule(CommandModule):
         if not build_mini_installer(ctx):
             raise RuntimeError("Failed to build mini_installer")
 
-    def _sign_installer(self, build_output_dir: Path, env: EnvConfig) -> Path:
+    def _sign_installer(self, mini_installer_path: Path, env: EnvConfig) -> Path:
         log_info("\nStep 3/3: Signing mini_installer.exe...")
-        mini_installer_path = build_output_dir / "mini_installer.exe"
         if not mini_installer_path.exists():
             raise RuntimeError(f"mini_installer.exe not found at: {mini_installer_path}")
 
@@ -146,100 +156,156 @@ def sign_with_codesigntool(
             log_warning("  ESIGNER_CREDENTIAL_ID is recommended but optional")
         return False
 
-    all_success = True
-    for binary in binaries:
-        try:
-            log_info(f"Signing {binary.name}...")
-
-            temp_output_dir = binary.parent / "signed_temp"
-            temp_output_dir.mkdir(exist_ok=True)
-
-            cmd = [
-                str(codesigntool_path),
-                "sign",
-                "-username",
-                env.esigner_username,
-                "-password",
-                f'"{env.esigner_password}"',
-            ]
-
-            if env.esigner_credential_id:
-                cmd.extend(["-credential_id", env.esigner_credential_id])
-
-            cmd.extend(
-                [
-                    "-totp_secret",
-                    env.esigner_totp_secret,
-                    "-input_file_path",
-                    str(binary),
-                    "-output_dir_path",
-                    str(temp_output_dir),
-                    "-override",
-                ]
+    workers = min(SIGN_WORKERS, len(binaries)) or 1
+
+    def _sign(indexed: Tuple[int, Path]) -> bool:
+        index, binary = indexed
+        # Offset the first wave so concurrent TOTP logins don't hit eSigner
+        # at once; later binaries start as a worker frees up, already apart
+        if index < workers:
+            time.sleep(index * SIGN_STAGGER_SECONDS)
+        return _sign_one(binary, codesigntool_path, env)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(_sign, enumerate(binaries)))
+
+    all_success = all(outcomes)
+    signed = [binary for binary, ok in zip(binaries, outcomes) if ok]
+
+    # One PowerShell process verifies every binary; its startup dominates
+    statuses = verify_authenticode_signatures(signed)
+    for binary in signed:
+        status = statuses.get(str(binary))
+        if status is None:
+            log_warning(f"Could not verify signature for {binary.name}")
+        elif status == "Valid":
+            log_success(f"✓ {binary.name} signed and verified successfully")
+        else:
+            log_error(
+                f"✗ {binary.name} signing verification failed - Status: {status}"
             )
+            all_success = False
 
-            cmd_str = " ".join(cmd)
-            log_info(f"Running: {cmd_str}")
+    return all_success
 
-            result = subprocess.run(
-                cmd_str,
-                shell=True,
-                capture_output=True,
-                text=True,
-                cwd=str(codesigntool_path.parent),
-            )
 
-            if result.stdout:
-                for line in result.stdout.split("\n"):
-                    if line.strip():
-                        log_info(line.strip())
-            if result.stderr:
-                for line in result.stderr.split("\n"):
-                    if line.strip() and "WARNING" not in line:
-                        log_error(line.strip())
-
-            if result.stdout and "Error:" in result.stdout:
-                log_error(
-                    f"✗ Failed to sign {binary.name} - Authentication or signing error"
-                )
-                all_success = False
-                continue
-
-            signed_file = temp_output_dir / binary.name
-            if signed_file.exists():
-                import shutil
-                shutil.move(str(signed_file), str(binary))
-                log_info(f"Moved signed {binary.name} to original location")
-
-            try:
-                temp_output_dir.rmdir()
-            except Exception:
-                pass
-
-            verify_cmd = [
-                "powershell",
-                "-Command",
-                f"(Get-AuthenticodeSignature '{binary}').Status",
+def _sign_one(binary: Path, codesigntool_path: Path, env: EnvConfig) -> bool:
+    """Sign one binary in place with CodeSignTool; False on any failure"""
+    try:
+        log_info(f"Signing {binary.name}...")
+
+        # Per-binary output dir: binaries sharing a directory sign concurrently
+        temp_output_dir = binary.parent / f"signed_temp_{binary.stem}"
+        temp_output_dir.mkdir(exist_ok=True)
+
+        cmd = [
+            str(codesigntool_path),
+            "sign",
+            "-username",
+            env.esigner_username,
+            "-password",
+            f'"{env.esigner_password}"',
+        ]
+
+        if env.esigner_credential_id:
+            cmd.extend(["-credential_id", env.esigner_credential_id])
+
+        cmd.extend(
+            [
+                "-totp_secret",
+                env.esigner_totp_secret,
+                "-input_file_path",
+                str(binary),
+                "-output_dir_path",
+                str(temp_output_dir),
+                "-override",
             ]
-            try:
-                verify_result = subprocess.run(
-                    verify_cmd, capture_output=True, text=True
-                )
-                if "Valid" in verify_result.stdout:
-                    log_success(f"✓ {binary.name} signed and verified successfully")
-                else:
-                    log_error(
-                        f"✗ {binary.name} signing verification failed - Status: {verify_result.stdout.strip()}"
-                    )
-                    all_success = False
-            except Exception:
-                log_warning(f"Could not verify signature for {binary.name}")
-
-        except Exception as e:
-            log_error(f"Failed to sign {binary.name}: {e}")
-            all_success = False
+        )
+
+        # CodeSignTool.bat runs under cmd.exe whether or not shell=True,
+        # so the command line is kept as one string with the password
+        # quoted for cmd; only the logged copy has the secrets masked
+        cmd_str = " ".join(cmd)
+        secrets = {f'"{env.esigner_password}"', env.esigner_totp_secret}
+        log_info(
+            "Running: " + " ".join("****" if arg in secrets else arg for arg in cmd)
+        )
+
+        result = subprocess.run(
+            cmd_str,
+            shell=True,
+            capture_output=True,
+            text=True,
+            cwd=str(codesigntool_path.parent),
+        )
+
+        if result.stdout:
+            for line in result.stdout.splitlines():
+                if line.strip():
+                    log_info(line.strip())
+        if result.stderr:
+            for line in result.stderr.splitlines():
+                if line.strip() and "WARNING" not in line:
+                    log_error(line.strip())
+
+        if result.stdout and "Error:" in result.stdout:
+            log_error(
+                f"✗ Failed to sign {binary.name} - Authentication or signing error"
+            )
+            return False
 
-    return all_success
+        signed_file = temp_output_dir / binary.name
+        if signed_file.exists():
+            shutil.move(str(signed_file), str(binary))
+            log_info(f"Moved signed {binary.name} to original location")
+
+        try:
+            temp_output_dir.rmdir()
+        except Exception:
+            pass
+
+        return True
+
+    except Exception as e:
+        log_error(f"Failed to sign {binary.name}: {e}")
+        return False
+
+
+def verify_authenticode_signatures(binaries: List[Path]) -> Dict[str, str]:
+    """Authenticode status ("Valid", "NotSigned", ...) per binary path
+
+    Binaries whose status couldn't be read are missing from the result.
+    """
+    if not binaries:
+        return {}
+
+    # Single-quoted PowerShell literals; a quote is escaped by doubling it
+    paths = ",".join("'" + str(b).replace("'", "''") + "'" for b in binaries)
+    script = (
+        f"ConvertTo-Json -Compress -InputObject @(Get-AuthenticodeSignature "
+        f"-LiteralPath @({paths}) | ForEach-Object "
+        "{ [pscustomobject]@{ Path = $_.Path; Status = [string]$_.Status } })"
+    )
+    try:
+        result = subprocess.run(
+            ["powershell", "-NoProfile", "-Command", script],
+            capture_output=True,
+            text=True,
+        )
+        entries = json.loads(result.stdout)
+    except Exception:
+        return {}
+
+    statuses = {
+        os.path.normcase(entry["Path"]): entry.get("Status")
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("Path")
+    }
+    return {
+        str(binary): statuses[os.path.normcase(str(binary))]
+        for binary in binaries
+        if os.path.normcase(str(binary)) in statuses
+    }
 
 
 def sign_universal(contexts: List[Context]) -> bool:
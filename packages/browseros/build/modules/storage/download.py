@@ -37,6 +37,8 @@ class DownloadResourcesModule(CommandModule):
     produces = []
     requires = []
     description = "Download resources from Cloudflare R2"
+    # Writes only under root_dir/resources, so it can overlap the setup phase
+    depends_on = []
 
     def validate(self, context: Context) -> None:
         if not BOTO3_AVAILABLE:
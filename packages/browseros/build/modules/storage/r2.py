@@ -5,21 +5,37 @@ This module provides shared R2 (S3-compatible) operations used by both
 upload and download modules.
 """
 
+import hashlib
 import json
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Dict, Optional
 
 from ...common.env import EnvConfig
 from ...common.utils import log_info, log_error, log_success, log_warning
 
-# Try to import boto3 for R2 (S3-compatible)
-try:
-    import boto3
-    from botocore.config import Config
+# boto3 (S3-compatible client for R2) is only probed here, not imported: it
+# takes ~200ms to load and every CLI invocation, even --help, imports this module
+BOTO3_AVAILABLE = find_spec("boto3") is not None and find_spec("botocore") is not None
 
-    BOTO3_AVAILABLE = True
-except ImportError:
-    BOTO3_AVAILABLE = False
+# Multipart settings for artifact uploads. Installers are hundreds of MB, so
+# larger parts sent over parallel streams beat boto3's 8MB defaults on WAN links.
+MULTIPART_THRESHOLD = 32 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+MULTIPART_CONCURRENCY = 8
+
+
+@lru_cache(maxsize=1)
+def _get_transfer_config():
+    """TransferConfig used for R2 uploads (built once, boto3 imported lazily)"""
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=MULTIPART_CHUNKSIZE,
+        max_concurrency=MULTIPART_CONCURRENCY,
+    )
 
 
 def get_r2_client(env: Optional[EnvConfig] = None):
@@ -42,11 +58,27 @@ def get_r2_client(env: Optional[EnvConfig] = None):
         log_error("R2 configuration not set")
         return None
 
+    return _create_r2_client(
+        env.r2_endpoint_url, env.r2_access_key_id, env.r2_secret_access_key
+    )
+
+
+@lru_cache(maxsize=4)
+def _create_r2_client(endpoint_url: str, access_key_id: str, secret_access_key: str):
+    """Build the boto3 client once per credential set
+
+    Client construction loads the S3 service model and sets up a connection
+    pool; release/OTA flows ask for a client several times per run. boto3
+    clients are thread-safe, so sharing one is fine.
+    """
+    import boto3
+    from botocore.config import Config
+
     return boto3.client(
         "s3",
-        endpoint_url=env.r2_endpoint_url,
-        aws_access_key_id=env.r2_access_key_id,
-        aws_secret_access_key=env.r2_secret_access_key,
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
         config=Config(
             signature_version="s3v4",
             retries={"max_attempts": 3, "mode": "standard"},
@@ -54,11 +86,33 @@ def get_r2_client(env: Optional[EnvConfig] = None):
     )
 
 
+def _file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file, streamed through OpenSSL"""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _remote_sha256(client, bucket: str, r2_key: str, size: int) -> Optional[str]:
+    """sha256 metadata of r2_key if it exists with this size, else None
+
+    Relies on the sha256 metadata written by upload_file_to_r2; S3 ETags
+    of multipart uploads are not content digests.
+    """
+    try:
+        head = client.head_object(Bucket=bucket, Key=r2_key)
+    except Exception:
+        return None
+    if head.get("ContentLength") != size:
+        return None
+    return head.get("Metadata", {}).get("sha256")
+
+
 def upload_file_to_r2(
     client,
     local_path: Path,
     r2_key: str,
     bucket: str,
+    skip_unchanged: bool = False,
 ) -> bool:
     """Upload a single file to R2
 
@@ -67,13 +121,40 @@ def upload_file_to_r2(
         local_path: Path to local file
         r2_key: Key (path) in R2 bucket
         bucket: R2 bucket name
+        skip_unchanged: Skip the upload if the existing object has the same
+                        SHA-256 (recorded as object metadata on upload)
 
     Returns:
-        True if successful, False otherwise
+        True if successful (or skipped as unchanged), False otherwise
     """
     try:
+        if not skip_unchanged:
+            log_info(f"Uploading {local_path.name}...")
+            client.upload_file(
+                str(local_path), bucket, r2_key, Config=_get_transfer_config()
+            )
+            log_success(f"Uploaded: {r2_key}")
+            return True
+
+        remote_sha256 = _remote_sha256(
+            client, bucket, r2_key, local_path.stat().st_size
+        )
+        # Hash locally either way: the digest decides the skip and is stored
+        # as metadata in the same write, so the object never lacks it
+        sha256 = _file_sha256(local_path)
+        if sha256 == remote_sha256:
+            log_info(f"Skipped (unchanged): {r2_key}")
+            return True
+
         log_info(f"Uploading {local_path.name}...")
-        client.upload_file(str(local_path), bucket, r2_key)
+        client.upload_file(
+            str(local_path),
+            bucket,
+            r2_key,
+            ExtraArgs={"Metadata": {"sha256": sha256}},
+            Config=_get_transfer_config(),
+        )
+
         log_success(f"Uploaded: {r2_key}")
         return True
     except Exception as e:
@@ -2,7 +2,10 @@
 """Upload module for BrowserOS build artifacts to Cloudflare R2"""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -16,7 +19,7 @@ from ...common.utils import (
     IS_WINDOWS,
     IS_MACOS,
 )
-from ...common.notify import get_notifier, COLOR_GREEN
+from ...common.notify import record_upload
 
 from .r2 import (
     BOTO3_AVAILABLE,
@@ -24,7 +27,12 @@ from .r2 import (
     upload_file_to_r2,
 )
 
+# Upper bound on concurrent artifact uploads; uploads are network bound and
+# the boto3 client is thread-safe
+UPLOAD_WORKERS = 8
 
+
+@lru_cache(maxsize=1)
 def _get_platform() -> str:
     """Get platform name for R2 path"""
     if IS_MACOS():
@@ -165,16 +173,24 @@ def detect_artifacts(ctx: Context) -> List[Path]:
     if not dist_dir.exists():
         return []
 
-    artifacts = []
-
     if IS_MACOS():
-        artifacts.extend(dist_dir.glob("*.dmg"))
+        extensions = {".dmg"}
     elif IS_WINDOWS():
-        artifacts.extend(dist_dir.glob("*.exe"))
-        artifacts.extend(dist_dir.glob("*.zip"))
+        extensions = {".exe", ".zip"}
     else:  # Linux
-        artifacts.extend(dist_dir.glob("*.AppImage"))
-        artifacts.extend(dist_dir.glob("*.deb"))
+        extensions = {".AppImage", ".deb"}
+    # normcase keeps glob's case-insensitive matching on Windows
+    extensions = {os.path.normcase(ext) for ext in extensions}
+
+    # One directory pass instead of a glob per extension
+    with os.scandir(dist_dir) as entries:
+        artifacts = [
+            Path(entry.path)
+            for entry in entries
+            if not entry.name.startswith(".")
+            and os.path.normcase(os.path.splitext(entry.name)[1]) in extensions
+            and entry.is_file()
+        ]
 
     return sorted(artifacts)
 
@@ -222,13 +238,28 @@ def upload_release_artifacts(
         log_error("Failed to create R2 client")
         return False, None
 
+    with ThreadPoolExecutor(
+        max_workers=min(UPLOAD_WORKERS, len(artifacts))
+    ) as executor:
+        futures = [
+            executor.submit(
+                upload_file_to_r2,
+                client,
+                artifact_path,
+                f"{release_path}{artifact_path.name}",
+                env.r2_bucket,
+                skip_unchanged=True,
+            )
+            for artifact_path in artifacts
+        ]
+        for future in as_completed(futures):
+            if not future.result():
+                for pending in futures:
+                    pending.cancel()
+                return False, None
+
     artifact_metadata = []
     for artifact_path in artifacts:
-        r2_key = f"{release_path}{artifact_path.name}"
-
-        if not upload_file_to_r2(client, artifact_path, r2_key, env.r2_bucket):
-            return False, None
-
         metadata = {
             "filename": artifact_path.name,
             "size": artifact_path.stat().st_size,
@@ -254,19 +285,9 @@ def upload_release_artifacts(
         log_info(f"  Sparkle version: {release_data.get('sparkle_version', 'N/A')}")
     log_info(f"  Artifacts: {list(release_data['artifacts'].keys())}")
 
-    notifier = get_notifier()
-    artifact_urls = [
-        f"{a['filename']}: {a['url']}" for a in release_data["artifacts"].values()
-    ]
-    notifier.notify(
-        "Upload Complete",
-        f"Uploaded {len(artifacts)} artifact(s) to R2",
-        {
-            "Version": release_data["version"],
-            "Platform": platform,
-            "Artifacts": "\n".join(artifact_urls),
-        },
-        color=COLOR_GREEN,
+    record_upload(
+        f"{platform} {ctx.architecture} v{release_data['version']}",
+        [f"{a['filename']}: {a['url']}" for a in release_data["artifacts"].values()],
     )
 
     return True, release_data